@@ -1,37 +1,64 @@
-import subprocess
+import click
+import functools
+import os
+import random
 import boto3
 import time
 import psutil
 import redis
 
-def stop_instance(instance_id, region):
-    ec2_client = boto3.client('ec2', region_name=region)
+from instancehub.core.monitor import stop_on_signals
+
+@functools.lru_cache(maxsize=1)
+def _session():
+    return boto3.session.Session()
+
+@functools.lru_cache(maxsize=8)
+def _ec2_client(region):
+    # Building a client loads credentials and service models, so do it once per region
+    return _session().client('ec2', region_name=region)
+
+# Poll every 15 seconds for up to 10 minutes
+WAITER_CONFIG = {'Delay': 15, 'MaxAttempts': 40}
+
+def stop_instance(instance_id, region, ec2_client=None):
+    ec2_client = ec2_client or _ec2_client(region)
 
     # Stop the instance
     ec2_client.stop_instances(InstanceIds=[instance_id])
     print(f"Instance {instance_id} is stopping...")
 
-    # Wait for 10 minutes
-    time.sleep(600)
+    # Wait until the instance has actually stopped
+    ec2_client.get_waiter('instance_stopped').wait(InstanceIds=[instance_id], WaiterConfig=WAITER_CONFIG)
+    print(f"Instance {instance_id} is stopped")
 
-def start_instance(instance_id, region):
-    ec2_client = boto3.client('ec2', region_name=region)
+def start_instance(instance_id, region, ec2_client=None):
+    ec2_client = ec2_client or _ec2_client(region)
 
     # Start the instance
     ec2_client.start_instances(InstanceIds=[instance_id])
     print(f"Instance {instance_id} is starting up...")
 
-def monitor_cpu(threshold=90):
-    # Monitor CPU usage
-    while psutil.cpu_percent(interval=1) > threshold:
+    # Wait until the instance is running
+    ec2_client.get_waiter('instance_running').wait(InstanceIds=[instance_id], WaiterConfig=WAITER_CONFIG)
+    print(f"Instance {instance_id} is running")
+
+def monitor_cpu(threshold=90, base_interval=1, max_interval=10):
+    # Monitor CPU usage; cpu_percent blocks for the sampling interval itself,
+    # so no extra sleep is needed between samples
+    interval = base_interval
+    while psutil.cpu_percent(interval=interval) > threshold:
         print(f"CPU usage is above {threshold}%, waiting for it to decrease...")
-        time.sleep(10)
+        # Back off while waiting instead of waking up at a fixed rate
+        interval = min(interval * 2, max_interval)
 
-def monitor_ram(threshold=90):
+def monitor_ram(threshold=90, base_interval=1, max_interval=10):
     # Monitor RAM usage
+    interval = base_interval
     while psutil.virtual_memory().percent > threshold:
         print(f"RAM usage is above {threshold}%, waiting for it to decrease...")
-        time.sleep(10)
+        time.sleep(interval)
+        interval = min(interval * 2, max_interval)
 
 def increase_cpu():
     # You can implement logic here to increase CPU usage
@@ -49,68 +76,93 @@ def reset_ram():
     # You can implement logic here to reset RAM usage to normal levels
     print("Resetting RAM usage to normal...")
 
-def connect_to_redis():
-    # Replace the placeholders with your actual Redis server details
-    redis_host = "your_redis_host"
-    redis_port = 6379
+# Replace the placeholders with your actual Redis server details
+redis_host = "your_redis_host"
+redis_port = 6379
 
+# Shared pool so repeated calls reuse TCP connections instead of reconnecting
+_redis_pool = redis.ConnectionPool(host=redis_host, port=redis_port, decode_responses=True, max_connections=10)
+
+def connect_to_redis(total_requests=10000, pipeline_depth=1000):
     # Connect to Redis
-    r = redis.StrictRedis(host=redis_host, port=redis_port, decode_responses=True)
+    r = redis.Redis(connection_pool=_redis_pool)
     print("Connected to Redis")
 
-    # Use memtier_benchmark to write data to Redis
-    subprocess.run(["memtier_benchmark", "--server", redis_host, "--port", str(redis_port), "--protocol", "redis", "--clients", "1", "--threads", "1", "--ratio", "1:0", "--key-pattern", "R:R", "--data-size-range", "1-100", "--data-size-pattern", "R", "--pipeline", "1", "--requests", "10000"])
+    # Write random 1-100 byte values, sending one pipeline per batch of keys
+    for start in range(0, total_requests, pipeline_depth):
+        pipe = r.pipeline(transaction=False)
+        for i in range(start, min(start + pipeline_depth, total_requests)):
+            pipe.set(f"k{i}", os.urandom(random.randint(1, 100)))
+        pipe.execute()
+    print(f"Wrote {total_requests} keys to Redis")
 
 def check_redis_stats():
-    # Replace the placeholders with your actual Redis server details
-    redis_host = "your_redis_host"
-    redis_port = 6379
-
     # Connect to Redis
-    r = redis.StrictRedis(host=redis_host, port=redis_port, decode_responses=True)
+    r = redis.Redis(connection_pool=_redis_pool)
+
+    # Fetch CPU and memory sections in a single round trip
+    pipe = r.pipeline(transaction=False)
+    pipe.info('cpu')
+    pipe.info('memory')
+    cpu_info, memory_info = pipe.execute()
 
     # Check CPU usage
-    cpu_info = r.info('cpu')
     print(f"Redis CPU Usage: {cpu_info['used_cpu_sys']}")
 
     # Check memory usage
-    memory_info = r.info('memory')
     print(f"Redis Memory Usage: {memory_info['used_memory_human']}")
 
+def wait_interruptibly(seconds):
+    # Wait on an event rather than sleeping so Ctrl-C / SIGTERM end the wait at
+    # once; the previous signal handlers are restored afterwards
+    with stop_on_signals() as stop:
+        return stop.wait(seconds)
+
+@click.group()
+def cli():
+    """Instance control actions that can be scripted or run in parallel."""
+
+@cli.command()
+@click.argument('instance_id', envvar='AWS_INSTANCE_ID')
+@click.option('--region', envvar='AWS_DEFAULT_REGION', required=True, help='AWS region')
+def stop(instance_id, region):
+    """Stop an instance and start it again."""
+    stop_instance(instance_id, region)
+    start_instance(instance_id, region)
+
+@cli.command()
+@click.option('--threshold', default=90, help='Wait until CPU usage drops below this percentage')
+@click.option('--hold', default=300, help='Seconds to observe the increased CPU usage')
+def cpu(threshold, hold):
+    """Monitor CPU usage and increase it."""
+    monitor_cpu(threshold)
+    increase_cpu()
+    # Wait for a while to observe increased CPU usage
+    wait_interruptibly(hold)
+    reset_cpu()
+
+@cli.command()
+@click.option('--threshold', default=90, help='Wait until RAM usage drops below this percentage')
+@click.option('--hold', default=300, help='Seconds to observe the increased RAM usage')
+def ram(threshold, hold):
+    """Monitor RAM usage and increase it."""
+    monitor_ram(threshold)
+    increase_ram()
+    # Wait for a while to observe increased RAM usage
+    wait_interruptibly(hold)
+    reset_ram()
+
+@cli.command('redis-write')
+@click.option('--requests', default=10000, help='Number of keys to write')
+@click.option('--pipeline-depth', default=1000, help='Commands sent per pipeline round trip')
+def redis_write(requests, pipeline_depth):
+    """Connect to Redis and write data."""
+    connect_to_redis(requests, pipeline_depth)
+
+@cli.command('redis-stats')
+def redis_stats():
+    """Check Redis stats."""
+    check_redis_stats()
+
 if __name__ == "__main__":
-    # Replace the placeholders with your actual values
-    instance_id = "your_instance_id"
-    region = "your_aws_region"
-
-    # Prompt user for action
-    user_choice = input("Choose an action:\n1. Stop Instance\n2. Increase CPU\n3. Increase RAM\n4. Connect to Redis and Write Data\n5. Check Redis Stats\nEnter the corresponding number: ")
-
-    if user_choice == "1":
-        # Stop the instance for 10 minutes
-        stop_instance(instance_id, region)
-        # Start the instance again
-        start_instance(instance_id, region)
-    elif user_choice == "2":
-        # Monitor CPU usage and increase it
-        monitor_cpu()
-        increase_cpu()
-        # Wait for a while to observe increased CPU usage
-        time.sleep(300)
-        # Reset CPU usage
-        reset_cpu()
-    elif user_choice == "3":
-        # Monitor RAM usage and increase it
-        monitor_ram()
-        increase_ram()
-        # Wait for a while to observe increased RAM usage
-        time.sleep(300)
-        # Reset RAM usage
-        reset_ram()
-    elif user_choice == "4":
-        # Connect to Redis and write data
-        connect_to_redis()
-    elif user_choice == "5":
-        # Check Redis stats
-        check_redis_stats()
-    else:
-        print("Invalid choice. Please enter 1, 2, 3, 4, or 5.")
+    cli()
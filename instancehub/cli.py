@@ -2,20 +2,42 @@
 Main CLI entry point for InstanceHub.
 """
 
+import importlib
+
 import click
-from rich.console import Console
-from rich.table import Table
-from rich import print as rprint
 
-from instancehub.commands.instances import instances
-from instancehub.commands.monitor import monitor
-from instancehub.commands.services import services
-from instancehub.commands.config import config
 from instancehub.utils.output import setup_console
 
-console = Console()
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when they are used.
+    
+    Subcommands are given as a mapping of command name to the dotted path of
+    the command object, e.g. ``{'config': 'instancehub.commands.config.config'}``.
+    """
+    
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+    
+    def list_commands(self, ctx):
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+    
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+    
+    def _load_command(self, cmd_name):
+        module_name, attr_name = self.lazy_subcommands[cmd_name].rsplit('.', 1)
+        module = importlib.import_module(module_name)
+        return getattr(module, attr_name)
 
-@click.group()
+@click.group(cls=LazyGroup, lazy_subcommands={
+    'instances': 'instancehub.commands.instances.instances',
+    'monitor': 'instancehub.commands.monitor.monitor',
+    'services': 'instancehub.commands.services.services',
+    'config': 'instancehub.commands.config.config',
+})
 @click.version_option(version="1.0.0", prog_name="InstanceHub")
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
 @click.option('--config-file', '-c', help='Path to configuration file')
@@ -36,15 +58,12 @@ def main(ctx, verbose, config_file):
     
     setup_console(verbose)
 
-# Add command groups
-main.add_command(instances)
-main.add_command(monitor)
-main.add_command(services)
-main.add_command(config)
-
 @main.command()
 def info():
     """Show InstanceHub information and status."""
+    from rich.table import Table
+    from instancehub.utils.output import get_console
+    
     table = Table(title="InstanceHub Information")
     table.add_column("Property", style="cyan")
     table.add_column("Value", style="green")
@@ -54,7 +73,7 @@ def info():
     table.add_row("Description", "Cloud instance and system management tool")
     table.add_row("Commands", "instances, monitor, services, config")
     
-    console.print(table)
+    get_console().print(table)
 
 if __name__ == '__main__':
     main()
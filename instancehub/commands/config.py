@@ -2,17 +2,36 @@
 Configuration management commands.
 """
 
+import ast
 import click
+import functools
+import operator
 import os
+import shlex
+import shutil
+import subprocess
 import yaml
 from pathlib import Path
 from rich.table import Table
-from rich import print as rprint
 
 from instancehub.utils.output import (
-    console, print_success, print_error, print_warning, print_info
+    get_console, print_success, print_error, print_warning, print_info
 )
-from instancehub.config.manager import ConfigManager
+from instancehub.config.manager import ConfigManager, flatten_config
+
+def _coerce(value):
+    """Convert a command-line string to the Python value it spells."""
+    if value.lower() in ('true', 'false'):
+        return value.lower() == 'true'
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return value
+
+def _complete_key(ctx, param, incomplete):
+    """Shell-complete dot-notation configuration keys."""
+    keys = flatten_config(ConfigManager().create_default_config())
+    return [key for key in keys if key.startswith(incomplete)]
 
 @click.group()
 def config():
@@ -58,7 +77,7 @@ def init(force):
         print_success(f"Configuration initialized at: {config_manager.config_path}")
         
         # Show the created configuration
-        show_config()
+        show_config(default_config)
         
     except Exception as e:
         print_error(f"Error initializing configuration: {e}")
@@ -68,69 +87,69 @@ def show():
     """Show current configuration."""
     show_config()
 
-def show_config():
-    """Helper function to display configuration."""
+def show_config(config_data=None):
+    """Helper function to display configuration.
+    
+    Callers that already hold the configuration can pass it in to skip
+    re-reading the file.
+    """
     config_manager = ConfigManager()
     
-    if not config_manager.config_exists():
+    if config_data is None and not config_manager.config_exists():
         print_warning("No configuration found. Run 'instancehub config init' to create one.")
         return
     
     try:
-        config_data = config_manager.load_config()
+        if config_data is None:
+            config_data = config_manager.load_config()
         
         print_info(f"Configuration file: {config_manager.config_path}")
         
-        # AWS Configuration
-        aws_config = config_data.get('aws', {})
-        aws_table = Table(title="AWS Configuration")
-        aws_table.add_column("Setting", style="cyan")
-        aws_table.add_column("Value", style="white")
-        
-        aws_table.add_row("Default Region", aws_config.get('default_region', 'Not set'))
-        aws_table.add_row("Profile", aws_config.get('profile', 'Not set'))
-        
-        # Monitoring Configuration
-        monitoring_config = config_data.get('monitoring', {})
-        monitoring_table = Table(title="Monitoring Configuration")
-        monitoring_table.add_column("Setting", style="cyan")
-        monitoring_table.add_column("Value", style="white")
-        
-        monitoring_table.add_row("CPU Threshold", f"{monitoring_config.get('cpu_threshold', 90)}%")
-        monitoring_table.add_row("Memory Threshold", f"{monitoring_config.get('memory_threshold', 90)}%")
-        monitoring_table.add_row("Disk Threshold", f"{monitoring_config.get('disk_threshold', 90)}%")
-        monitoring_table.add_row("Refresh Interval", f"{monitoring_config.get('refresh_interval', 2)}s")
-        
-        # Redis Configuration
-        redis_config = config_data.get('redis', {})
-        redis_table = Table(title="Redis Configuration")
-        redis_table.add_column("Setting", style="cyan")
-        redis_table.add_column("Value", style="white")
-        
-        redis_table.add_row("Default Host", redis_config.get('default_host', 'localhost'))
-        redis_table.add_row("Default Port", str(redis_config.get('default_port', 6379)))
-        redis_table.add_row("Default DB", str(redis_config.get('default_db', 0)))
-        
-        # Output Configuration
-        output_config = config_data.get('output', {})
-        output_table = Table(title="Output Configuration")
-        output_table.add_column("Setting", style="cyan")
-        output_table.add_column("Value", style="white")
-        
-        output_table.add_row("Color", str(output_config.get('color', True)))
-        output_table.add_row("Verbose", str(output_config.get('verbose', False)))
-        output_table.add_row("Format", output_config.get('format', 'table'))
-        
-        console.print(aws_table)
-        console.print(monitoring_table)
-        console.print(redis_table)
-        console.print(output_table)
+        get_console().print(
+            _render_section("AWS Configuration", config_data.get('aws', {}), [
+                ("Default Region", 'default_region', 'Not set', str),
+                ("Profile", 'profile', 'Not set', str),
+            ]),
+            _render_section("Monitoring Configuration", config_data.get('monitoring', {}), [
+                ("CPU Threshold", 'cpu_threshold', 90, _percent),
+                ("Memory Threshold", 'memory_threshold', 90, _percent),
+                ("Disk Threshold", 'disk_threshold', 90, _percent),
+                ("Refresh Interval", 'refresh_interval', 2, _seconds),
+            ]),
+            _render_section("Redis Configuration", config_data.get('redis', {}), [
+                ("Default Host", 'default_host', 'localhost', str),
+                ("Default Port", 'default_port', 6379, str),
+                ("Default DB", 'default_db', 0, str),
+            ]),
+            _render_section("Output Configuration", config_data.get('output', {}), [
+                ("Color", 'color', True, str),
+                ("Verbose", 'verbose', False, str),
+                ("Format", 'format', 'table', str),
+            ]),
+        )
         
     except Exception as e:
         print_error(f"Error reading configuration: {e}")
 
+def _percent(value):
+    return f"{value}%"
+
+def _seconds(value):
+    return f"{value}s"
+
+def _render_section(title, section, rows):
+    """Build a settings table from (label, key, default, formatter) rows."""
+    table = Table(title=title)
+    table.add_column("Setting", style="cyan")
+    table.add_column("Value", style="white")
+    
+    for label, key, default, fmt in rows:
+        table.add_row(label, fmt(section.get(key, default)))
+    
+    return table
+
 @config.command()
-@click.argument('key')
+@click.argument('key', shell_complete=_complete_key)
 @click.argument('value')
 def set(key, value):
     """Set a configuration value."""
@@ -139,26 +158,13 @@ def set(key, value):
     try:
         config_data = config_manager.load_config() or {}
         
-        # Parse nested key (e.g., "aws.default_region")
-        keys = key.split('.')
-        current = config_data
-        
-        # Navigate to the parent of the target key
-        for k in keys[:-1]:
-            if k not in current:
-                current[k] = {}
-            current = current[k]
-        
-        # Convert value to appropriate type
-        if value.lower() in ['true', 'false']:
-            value = value.lower() == 'true'
-        elif value.isdigit():
-            value = int(value)
-        elif value.replace('.', '').isdigit():
-            value = float(value)
+        # Parse nested key (e.g., "aws.default_region") and create any
+        # missing parents on the way down
+        *parents, leaf = key.split('.')
+        parent = functools.reduce(lambda d, k: d.setdefault(k, {}), parents, config_data)
         
-        # Set the value
-        current[keys[-1]] = value
+        value = _coerce(value)
+        parent[leaf] = value
         
         config_manager.save_config(config_data)
         print_success(f"Set {key} = {value}")
@@ -167,7 +173,7 @@ def set(key, value):
         print_error(f"Error setting configuration: {e}")
 
 @config.command()
-@click.argument('key')
+@click.argument('key', shell_complete=_complete_key)
 def get(key):
     """Get a configuration value."""
     config_manager = ConfigManager()
@@ -180,15 +186,11 @@ def get(key):
             return
         
         # Parse nested key
-        keys = key.split('.')
-        current = config_data
-        
-        for k in keys:
-            if isinstance(current, dict) and k in current:
-                current = current[k]
-            else:
-                print_error(f"Configuration key '{key}' not found.")
-                return
+        try:
+            current = functools.reduce(operator.getitem, key.split('.'), config_data)
+        except (KeyError, TypeError):
+            print_error(f"Configuration key '{key}' not found.")
+            return
         
         print_info(f"{key} = {current}")
         
@@ -205,8 +207,15 @@ def edit():
         return
     
     try:
-        editor = os.environ.get('EDITOR', 'notepad' if os.name == 'nt' else 'nano')
-        os.system(f'{editor} "{config_manager.config_path}"')
+        default_editor = 'notepad' if os.name == 'nt' else 'nano'
+        editor = os.environ.get('EDITOR', default_editor)
+        
+        # Run the editor directly rather than through a shell; EDITOR may
+        # carry arguments, e.g. "code --wait". An empty or blank EDITOR
+        # falls back to the platform default.
+        command = shlex.split(editor, posix=os.name != 'nt') or [default_editor]
+        command[0] = shutil.which(command[0]) or command[0]
+        subprocess.run([*command, str(config_manager.config_path)], check=False)
         print_success("Configuration file opened in editor.")
         
     except Exception as e:
@@ -228,28 +237,7 @@ def validate():
         return
     
     try:
-        config_data = config_manager.load_config()
-        
-        # Basic validation
-        errors = []
-        
-        # Check AWS configuration
-        aws_config = config_data.get('aws', {})
-        if 'default_region' not in aws_config:
-            errors.append("Missing aws.default_region")
-        
-        # Check monitoring thresholds
-        monitoring_config = config_data.get('monitoring', {})
-        for threshold in ['cpu_threshold', 'memory_threshold', 'disk_threshold']:
-            value = monitoring_config.get(threshold)
-            if value is not None and (not isinstance(value, (int, float)) or value < 0 or value > 100):
-                errors.append(f"Invalid {threshold}: must be between 0 and 100")
-        
-        # Check Redis configuration
-        redis_config = config_data.get('redis', {})
-        port = redis_config.get('default_port')
-        if port is not None and (not isinstance(port, int) or port < 1 or port > 65535):
-            errors.append("Invalid redis.default_port: must be between 1 and 65535")
+        is_valid, errors = config_manager.validate_config()
         
         if errors:
             print_error("Configuration validation failed:")
@@ -3,35 +3,42 @@ AWS EC2 instance management commands.
 """
 
 import click
-import boto3
-from botocore.exceptions import ClientError, NoCredentialsError
 from rich.table import Table
-from rich import print as rprint
+from rich.text import Text
 
 from instancehub.utils.output import (
-    console, print_success, print_error, print_warning, 
-    create_table, create_progress
+    get_console, print_success, print_error, print_warning, 
+    create_table, create_progress, GREEN_STYLE, RED_STYLE
 )
-from instancehub.core.aws import EC2Manager
 
 @click.group()
-def instances():
+@click.pass_context
+def instances(ctx):
     """Manage AWS EC2 instances."""
-    pass
+    ctx.ensure_object(dict)
+    ctx.obj.setdefault('ec2', {})
+
+def _get_ec2_manager(ctx, region):
+    """Return the EC2Manager for a region, shared across the invocation."""
+    from instancehub.core.aws import EC2Manager
+    
+    managers = ctx.obj['ec2']
+    if region not in managers:
+        managers[region] = EC2Manager(region)
+    return managers[region]
 
 @instances.command()
 @click.option('--region', '-r', default='us-east-1', help='AWS region')
 @click.option('--state', '-s', help='Filter by instance state (running, stopped, etc.)')
 @click.option('--tag', '-t', help='Filter by tag (key=value)')
-def list(region, state, tag):
+@click.option('--limit', '-l', type=click.IntRange(min=1), help='Maximum number of instances to show')
+@click.pass_context
+def list(ctx, region, state, tag, limit):
     """List all EC2 instances."""
+    from botocore.exceptions import ClientError, NoCredentialsError
+    
     try:
-        ec2_manager = EC2Manager(region)
-        instances_data = ec2_manager.list_instances(state_filter=state, tag_filter=tag)
-        
-        if not instances_data:
-            print_warning("No instances found matching the criteria.")
-            return
+        ec2_manager = _get_ec2_manager(ctx, region)
         
         table = Table(title=f"EC2 Instances in {region}")
         table.add_column("Instance ID", style="cyan")
@@ -41,18 +48,24 @@ def list(region, state, tag):
         table.add_column("Public IP", style="magenta")
         table.add_column("Private IP", style="white")
         
-        for instance in instances_data:
-            state_color = "green" if instance['state'] == "running" else "red"
+        # Rows are streamed straight from the paginator into the table
+        for instance in ec2_manager.iter_instances(state_filter=state, tag_filter=tag, limit=limit):
+            # Pre-built styles let the state cell skip Rich's markup parser
+            state_style = GREEN_STYLE if instance['state'] == "running" else RED_STYLE
             table.add_row(
                 instance['id'],
                 instance['name'],
-                f"[{state_color}]{instance['state']}[/{state_color}]",
+                Text(instance['state'], style=state_style),
                 instance['type'],
                 instance['public_ip'] or "N/A",
                 instance['private_ip'] or "N/A"
             )
         
-        console.print(table)
+        if not table.row_count:
+            print_warning("No instances found matching the criteria.")
+            return
+        
+        get_console().print(table)
         
     except NoCredentialsError:
         print_error("AWS credentials not found. Please configure your credentials.")
@@ -62,70 +75,77 @@ def list(region, state, tag):
         print_error(f"Error listing instances: {e}")
 
 @instances.command()
-@click.argument('instance_id')
+@click.argument('instance_ids', nargs=-1, required=True)
 @click.option('--region', '-r', default='us-east-1', help='AWS region')
-@click.option('--wait', '-w', is_flag=True, help='Wait for instance to start')
-def start(instance_id, region, wait):
-    """Start an EC2 instance."""
+@click.option('--wait', '-w', is_flag=True, help='Wait for instances to start')
+@click.pass_context
+def start(ctx, instance_ids, region, wait):
+    """Start one or more EC2 instances."""
     try:
-        ec2_manager = EC2Manager(region)
+        ec2_manager = _get_ec2_manager(ctx, region)
+        ids = ', '.join(instance_ids)
         
         with create_progress() as progress:
-            task = progress.add_task("Starting instance...", total=None)
-            result = ec2_manager.start_instance(instance_id, wait=wait)
+            task = progress.add_task("Starting instances...", total=None)
+            result = ec2_manager.start_instance(instance_ids, wait=wait)
             progress.update(task, completed=True)
         
         if result:
-            print_success(f"Instance {instance_id} started successfully.")
+            print_success(f"Instance {ids} started successfully.")
         else:
-            print_error(f"Failed to start instance {instance_id}.")
+            print_error(f"Failed to start instance {ids}.")
             
     except Exception as e:
         print_error(f"Error starting instance: {e}")
 
 @instances.command()
-@click.argument('instance_id')
+@click.argument('instance_ids', nargs=-1, required=True)
 @click.option('--region', '-r', default='us-east-1', help='AWS region')
-@click.option('--wait', '-w', is_flag=True, help='Wait for instance to stop')
-def stop(instance_id, region, wait):
-    """Stop an EC2 instance."""
+@click.option('--wait', '-w', is_flag=True, help='Wait for instances to stop')
+@click.pass_context
+def stop(ctx, instance_ids, region, wait):
+    """Stop one or more EC2 instances."""
     try:
-        ec2_manager = EC2Manager(region)
+        ec2_manager = _get_ec2_manager(ctx, region)
+        ids = ', '.join(instance_ids)
         
         with create_progress() as progress:
-            task = progress.add_task("Stopping instance...", total=None)
-            result = ec2_manager.stop_instance(instance_id, wait=wait)
+            task = progress.add_task("Stopping instances...", total=None)
+            result = ec2_manager.stop_instance(instance_ids, wait=wait)
             progress.update(task, completed=True)
         
         if result:
-            print_success(f"Instance {instance_id} stopped successfully.")
+            print_success(f"Instance {ids} stopped successfully.")
         else:
-            print_error(f"Failed to stop instance {instance_id}.")
+            print_error(f"Failed to stop instance {ids}.")
             
     except Exception as e:
         print_error(f"Error stopping instance: {e}")
 
 @instances.command()
-@click.argument('instance_id')
+@click.argument('instance_ids', nargs=-1, required=True)
 @click.option('--region', '-r', default='us-east-1', help='AWS region')
-def status(instance_id, region):
-    """Get detailed status of an EC2 instance."""
+@click.pass_context
+def status(ctx, instance_ids, region):
+    """Get detailed status of one or more EC2 instances."""
     try:
-        ec2_manager = EC2Manager(region)
-        instance_info = ec2_manager.get_instance_details(instance_id)
-        
-        if not instance_info:
-            print_error(f"Instance {instance_id} not found.")
-            return
-        
-        table = Table(title=f"Instance Details: {instance_id}")
-        table.add_column("Property", style="cyan")
-        table.add_column("Value", style="white")
-        
-        for key, value in instance_info.items():
-            table.add_row(key, str(value))
-        
-        console.print(table)
+        ec2_manager = _get_ec2_manager(ctx, region)
+        details = ec2_manager.get_instance_details_bulk(instance_ids)
+        
+        for instance_id in instance_ids:
+            instance_info = details.get(instance_id)
+            if not instance_info:
+                print_error(f"Instance {instance_id} not found.")
+                continue
+            
+            table = Table(title=f"Instance Details: {instance_id}")
+            table.add_column("Property", style="cyan")
+            table.add_column("Value", style="white")
+            
+            for key, value in instance_info.items():
+                table.add_row(key, str(value))
+            
+            get_console().print(table)
         
     except Exception as e:
         print_error(f"Error getting instance status: {e}")
@@ -134,10 +154,11 @@ def status(instance_id, region):
 @click.argument('instance_id')
 @click.option('--region', '-r', default='us-east-1', help='AWS region')
 @click.option('--wait', '-w', is_flag=True, help='Wait for restart to complete')
-def restart(instance_id, region, wait):
+@click.pass_context
+def restart(ctx, instance_id, region, wait):
     """Restart an EC2 instance."""
     try:
-        ec2_manager = EC2Manager(region)
+        ec2_manager = _get_ec2_manager(ctx, region)
         
         with create_progress() as progress:
             task = progress.add_task("Restarting instance...", total=None)
@@ -3,20 +3,79 @@ System monitoring commands.
 """
 
 import click
+import heapq
+import threading
 import time
 import psutil
 from rich.table import Table
+from rich.text import Text
 from rich.live import Live
 from rich.panel import Panel
-from rich.columns import Columns
+from rich.layout import Layout
 from rich.progress import BarColumn, Progress, TextColumn
-from rich import print as rprint
 
 from instancehub.utils.output import (
-    console, print_success, print_error, print_warning, print_info,
-    create_table, format_bytes, format_uptime
+    get_console, print_success, print_error, print_warning, print_info,
+    create_table, format_bytes, format_uptime,
+    GREEN_STYLE, YELLOW_STYLE, RED_STYLE
 )
-from instancehub.core.monitor import SystemMonitor
+from instancehub.core.monitor import SystemMonitor, stop_on_signals
+
+# Sampling cadence for the threshold monitors: tight while above the
+# threshold, backing off exponentially while usage stays below it
+BASE_INTERVAL = 1
+MAX_INTERVAL = 8
+
+# Seconds over which per-process CPU usage is measured
+PROCESS_SAMPLE_INTERVAL = 0.5
+
+# Seconds between dashboard metric samples
+SAMPLE_INTERVAL = 1
+
+# Number of dashboard samples between CPU frequency reads
+CPU_FREQ_EVERY = 10
+
+# Dashboard regions per row; each row is as tall as its tallest rendered table
+DASHBOARD_ROWS = (
+    ('top', ('cpu', 'memory')),
+    ('bottom', ('disk', 'network', 'system')),
+)
+
+# CPU usage buckets for the process table, highest threshold first
+CPU_STYLES = (
+    (50.0, RED_STYLE),
+    (10.0, YELLOW_STYLE),
+    (0.0, GREEN_STYLE),
+)
+
+def _cpu_style(cpu_percent):
+    """Return the style for a CPU usage value."""
+    for floor, style in CPU_STYLES:
+        if cpu_percent >= floor:
+            return style
+    return CPU_STYLES[-1][1]
+
+def _counter_rates(previous, current, fields, elapsed):
+    """Per-second rates of cumulative counter fields between two samples."""
+    if previous is None or current is None or elapsed <= 0:
+        return None
+    # Counters can reset (e.g. an interface going away); never report negatives
+    return tuple(max(getattr(current, f) - getattr(previous, f), 0) / elapsed for f in fields)
+
+def _metrics_table(title, rows):
+    """Build a two-column Metric/Value table."""
+    table = Table(title=title)
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="white")
+    for metric, value in rows:
+        table.add_row(metric, value)
+    return table
+
+def _format_rate(rates, index):
+    """Format one entry of a rates tuple as bytes per second."""
+    if rates is None:
+        return "N/A"
+    return f"{format_bytes(rates[index])}/s"
 
 @click.group()
 def monitor():
@@ -29,88 +88,161 @@ def monitor():
 def dashboard(refresh, duration):
     """Real-time system monitoring dashboard."""
     system_monitor = SystemMonitor()
+    console = get_console()
     
-    def create_dashboard():
-        """Create the dashboard layout."""
-        # CPU Information
-        cpu_percent = psutil.cpu_percent(interval=1)
-        cpu_count = psutil.cpu_count()
-        cpu_freq = psutil.cpu_freq()
-        
-        cpu_table = Table(title="CPU Information")
-        cpu_table.add_column("Metric", style="cyan")
-        cpu_table.add_column("Value", style="white")
-        cpu_table.add_row("Usage", f"{cpu_percent}%")
-        cpu_table.add_row("Cores", str(cpu_count))
+    # Constant for the lifetime of the process, so query them only once
+    cpu_count = psutil.cpu_count()
+    boot_time = psutil.boot_time()
+    
+    # Sampling runs on a background thread and publishes into `samples`;
+    # rendering only ever reads the latest snapshot and never blocks
+    samples = {}
+    samples_lock = threading.Lock()
+    
+    def take_sample(frame):
+        """Collect one snapshot of system metrics."""
+        snapshot = {
+            'cpu_percent': psutil.cpu_percent(interval=None),
+            'memory': psutil.virtual_memory(),
+            'swap': psutil.swap_memory(),
+            'disk': psutil.disk_usage('/'),
+            'net_io': psutil.net_io_counters(),
+            'disk_io': psutil.disk_io_counters(),
+            'processes': len(psutil.pids()),
+            'load': psutil.getloadavg() if hasattr(psutil, 'getloadavg') else 'N/A',
+        }
+        # CPU frequency barely moves; re-read it every few samples
+        if frame % CPU_FREQ_EVERY == 0:
+            snapshot['cpu_freq'] = psutil.cpu_freq()
+        snapshot['sampled_ns'] = time.monotonic_ns()
+        return snapshot
+    
+    def sample_loop(stop):
+        """Refresh `samples` until `stop` is set."""
+        frame = 1
+        with samples_lock:
+            previous = dict(samples)
+        while not stop.wait(SAMPLE_INTERVAL):
+            # CPU usage is measured over the wait since the previous sample
+            snapshot = take_sample(frame)
+            elapsed = (snapshot['sampled_ns'] - previous['sampled_ns']) / 1e9
+            snapshot['net_rates'] = _counter_rates(
+                previous['net_io'], snapshot['net_io'], ('bytes_sent', 'bytes_recv'), elapsed)
+            snapshot['disk_rates'] = _counter_rates(
+                previous['disk_io'], snapshot['disk_io'], ('read_bytes', 'write_bytes'), elapsed)
+            with samples_lock:
+                samples.update(snapshot)
+            previous = snapshot
+            frame += 1
+    
+    # Fixed layout tree: regions are updated in place, and only when the
+    # values they show have changed since the previous frame
+    layout = Layout()
+    layout.split_column(*(Layout(name=row) for row, _ in DASHBOARD_ROWS))
+    for row, names in DASHBOARD_ROWS:
+        layout[row].split_row(*(Layout(name=name) for name in names))
+    dashboard_panel = Panel(layout, title="System Dashboard")
+    shown_rows = {}
+    tables = {}
+    shown_width = None
+    
+    def fit_rows(width):
+        """Size each row to its tallest table as rendered at the current width."""
+        # Panel borders and horizontal padding take four columns
+        inner_width = width - 4
+        total = 0
+        for row, names in DASHBOARD_ROWS:
+            options = console.options.update_width(max(inner_width // len(names), 1))
+            height = max(len(console.render_lines(tables[name], options, pad=False)) for name in names)
+            layout[row].size = height
+            total += height
+        dashboard_panel.height = total + 2
+    
+    def section_rows(current):
+        """Return (title, rows) for every dashboard region."""
+        cpu_freq = current.get('cpu_freq')
+        cpu_rows = [("Usage", f"{current['cpu_percent']}%"), ("Cores", str(cpu_count))]
         if cpu_freq:
-            cpu_table.add_row("Frequency", f"{cpu_freq.current:.0f} MHz")
-        
-        # Memory Information
-        memory = psutil.virtual_memory()
-        swap = psutil.swap_memory()
-        
-        memory_table = Table(title="Memory Information")
-        memory_table.add_column("Metric", style="cyan")
-        memory_table.add_column("Value", style="white")
-        memory_table.add_row("Total RAM", format_bytes(memory.total))
-        memory_table.add_row("Available", format_bytes(memory.available))
-        memory_table.add_row("Used", format_bytes(memory.used))
-        memory_table.add_row("Usage", f"{memory.percent}%")
-        memory_table.add_row("Swap Total", format_bytes(swap.total))
-        memory_table.add_row("Swap Used", format_bytes(swap.used))
-        
-        # Disk Information
-        disk_usage = psutil.disk_usage('/')
-        disk_table = Table(title="Disk Information")
-        disk_table.add_column("Metric", style="cyan")
-        disk_table.add_column("Value", style="white")
-        disk_table.add_row("Total", format_bytes(disk_usage.total))
-        disk_table.add_row("Used", format_bytes(disk_usage.used))
-        disk_table.add_row("Free", format_bytes(disk_usage.free))
-        disk_table.add_row("Usage", f"{(disk_usage.used / disk_usage.total) * 100:.1f}%")
-        
-        # Network Information
-        net_io = psutil.net_io_counters()
-        network_table = Table(title="Network Information")
-        network_table.add_column("Metric", style="cyan")
-        network_table.add_column("Value", style="white")
-        network_table.add_row("Bytes Sent", format_bytes(net_io.bytes_sent))
-        network_table.add_row("Bytes Received", format_bytes(net_io.bytes_recv))
-        network_table.add_row("Packets Sent", str(net_io.packets_sent))
-        network_table.add_row("Packets Received", str(net_io.packets_recv))
-        
-        # System Information
-        boot_time = psutil.boot_time()
-        uptime = time.time() - boot_time
-        
-        system_table = Table(title="System Information")
-        system_table.add_column("Metric", style="cyan")
-        system_table.add_column("Value", style="white")
-        system_table.add_row("Uptime", format_uptime(uptime))
-        system_table.add_row("Processes", str(len(psutil.pids())))
-        system_table.add_row("Load Average", str(psutil.getloadavg() if hasattr(psutil, 'getloadavg') else 'N/A'))
-        
-        # Create layout
-        top_row = Columns([cpu_table, memory_table])
-        bottom_row = Columns([disk_table, network_table, system_table])
-
-        from rich.console import Group
-        dashboard_group = Group(top_row, bottom_row)
-
-        return Panel(dashboard_group, title="System Dashboard")
+            cpu_rows.append(("Frequency", f"{cpu_freq.current:.0f} MHz"))
+        
+        memory = current['memory']
+        swap = current['swap']
+        disk_usage = current['disk']
+        disk_rates = current.get('disk_rates')
+        net_io = current['net_io']
+        net_rates = current.get('net_rates')
+        
+        return {
+            'cpu': ("CPU Information", cpu_rows),
+            'memory': ("Memory Information", [
+                ("Total RAM", format_bytes(memory.total)),
+                ("Available", format_bytes(memory.available)),
+                ("Used", format_bytes(memory.used)),
+                ("Usage", f"{memory.percent}%"),
+                ("Swap Total", format_bytes(swap.total)),
+                ("Swap Used", format_bytes(swap.used)),
+            ]),
+            'disk': ("Disk Information", [
+                ("Total", format_bytes(disk_usage.total)),
+                ("Used", format_bytes(disk_usage.used)),
+                ("Free", format_bytes(disk_usage.free)),
+                ("Usage", f"{(disk_usage.used / disk_usage.total) * 100:.1f}%"),
+                ("Read Rate", _format_rate(disk_rates, 0)),
+                ("Write Rate", _format_rate(disk_rates, 1)),
+            ]),
+            'network': ("Network Information", [
+                ("Bytes Sent", format_bytes(net_io.bytes_sent)),
+                ("Bytes Received", format_bytes(net_io.bytes_recv)),
+                ("Packets Sent", str(net_io.packets_sent)),
+                ("Packets Received", str(net_io.packets_recv)),
+                ("Send Rate", _format_rate(net_rates, 0)),
+                ("Receive Rate", _format_rate(net_rates, 1)),
+            ]),
+            'system': ("System Information", [
+                ("Uptime", format_uptime(time.time() - boot_time)),
+                ("Processes", str(current['processes'])),
+                ("Load Average", str(current['load'])),
+            ]),
+        }
     
-    try:
-        if duration > 0:
-            end_time = time.time() + duration
-        else:
-            end_time = float('inf')
-        
-        with Live(create_dashboard(), refresh_per_second=1/refresh) as live:
-            while time.time() < end_time:
-                live.update(create_dashboard())
-                time.sleep(refresh)
-                
-    except KeyboardInterrupt:
+    def create_dashboard():
+        """Refresh the dashboard layout from the latest samples."""
+        with samples_lock:
+            current = dict(samples)
+        
+        nonlocal shown_width
+        changed = False
+        for name, (title, rows) in section_rows(current).items():
+            if shown_rows.get(name) != rows:
+                tables[name] = _metrics_table(title, rows)
+                layout[name].update(tables[name])
+                shown_rows[name] = rows
+                changed = True
+        
+        # Rows wrap differently as values or the terminal width change
+        if changed or console.width != shown_width:
+            shown_width = console.width
+            fit_rows(shown_width)
+        
+        return dashboard_panel
+    
+    with stop_on_signals() as stop:
+        # Prime the CPU counters and take a first snapshot so the first
+        # frame has data before the sampler thread reports in
+        psutil.cpu_percent(interval=None)
+        samples.update(take_sample(0))
+        sampler = threading.Thread(target=sample_loop, args=(stop,), name="dashboard-sampler", daemon=True)
+        sampler.start()
+        
+        try:
+            # Live's refresh thread re-renders the dashboard on its own cadence
+            with Live(get_renderable=create_dashboard, console=console, refresh_per_second=1/refresh):
+                stop.wait(duration if duration > 0 else None)
+        finally:
+            interrupted = stop.is_set()
+            stop.set()
+    
+    if interrupted:
         print_success("Dashboard stopped.")
 
 @monitor.command()
@@ -122,25 +254,31 @@ def cpu(threshold, duration):
     
     print_info(f"Monitoring CPU usage (threshold: {threshold}%) for {duration} seconds...")
     
-    start_time = time.time()
+    interval = BASE_INTERVAL
     alerts_triggered = 0
     
-    try:
-        while time.time() - start_time < duration:
-            cpu_percent = psutil.cpu_percent(interval=1)
+    with stop_on_signals() as stop:
+        deadline = time.monotonic() + duration
+        psutil.cpu_percent(interval=None)
+        
+        while not stop.is_set() and time.monotonic() < deadline:
+            # Usage is measured over the wait, so the wait paces the loop
+            if stop.wait(max(min(interval, deadline - time.monotonic()), 0.1)):
+                break
+            cpu_percent = psutil.cpu_percent(interval=None)
             
             if cpu_percent > threshold:
                 alerts_triggered += 1
+                interval = BASE_INTERVAL
                 print_warning(f"CPU usage high: {cpu_percent}% (threshold: {threshold}%)")
             else:
+                interval = min(interval * 2, MAX_INTERVAL)
                 print_info(f"CPU usage: {cpu_percent}%")
-            
-            time.sleep(1)
-        
-        print_success(f"Monitoring completed. Alerts triggered: {alerts_triggered}")
-        
-    except KeyboardInterrupt:
+    
+    if stop.is_set():
         print_success("CPU monitoring stopped.")
+    else:
+        print_success(f"Monitoring completed. Alerts triggered: {alerts_triggered}")
 
 @monitor.command()
 @click.option('--threshold', '-t', default=90, help='Memory threshold percentage')
@@ -151,25 +289,29 @@ def memory(threshold, duration):
     
     print_info(f"Monitoring memory usage (threshold: {threshold}%) for {duration} seconds...")
     
-    start_time = time.time()
+    interval = BASE_INTERVAL
     alerts_triggered = 0
     
-    try:
-        while time.time() - start_time < duration:
+    with stop_on_signals() as stop:
+        deadline = time.monotonic() + duration
+        
+        while not stop.is_set() and time.monotonic() < deadline:
             memory = psutil.virtual_memory()
             
             if memory.percent > threshold:
                 alerts_triggered += 1
+                interval = BASE_INTERVAL
                 print_warning(f"Memory usage high: {memory.percent}% (threshold: {threshold}%)")
             else:
+                interval = min(interval * 2, MAX_INTERVAL)
                 print_info(f"Memory usage: {memory.percent}% ({format_bytes(memory.used)}/{format_bytes(memory.total)})")
             
-            time.sleep(2)
-        
-        print_success(f"Monitoring completed. Alerts triggered: {alerts_triggered}")
-        
-    except KeyboardInterrupt:
+            stop.wait(max(min(interval, deadline - time.monotonic()), 0))
+    
+    if stop.is_set():
         print_success("Memory monitoring stopped.")
+    else:
+        print_success(f"Monitoring completed. Alerts triggered: {alerts_triggered}")
 
 @monitor.command()
 @click.option('--path', '-p', default='/', help='Path to monitor')
@@ -189,7 +331,7 @@ def disk(path, threshold):
         table.add_row("Free", format_bytes(disk_usage.free))
         table.add_row("Usage", f"{usage_percent:.1f}%")
         
-        console.print(table)
+        get_console().print(table)
         
         if usage_percent > threshold:
             print_warning(f"Disk usage is above threshold: {usage_percent:.1f}% > {threshold}%")
@@ -203,15 +345,18 @@ def disk(path, threshold):
 def processes():
     """Show running processes."""
     try:
-        processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
-            try:
-                processes.append(proc.info)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+        # Per-process CPU usage is measured between two calls; prime the
+        # counters on psutil's cached Process objects before sampling
+        for proc in psutil.process_iter(['cpu_percent']):
+            pass
+        time.sleep(PROCESS_SAMPLE_INTERVAL)
         
-        # Sort by CPU usage
-        processes.sort(key=lambda x: x['cpu_percent'] or 0, reverse=True)
+        # Keep only the top entries instead of sorting the whole process list
+        top_processes = heapq.nlargest(
+            20,
+            (proc.info for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent'])),
+            key=lambda x: x['cpu_percent'] or 0.0
+        )
         
         table = Table(title="Top Processes by CPU Usage")
         table.add_column("PID", style="cyan")
@@ -219,15 +364,16 @@ def processes():
         table.add_column("CPU %", style="yellow")
         table.add_column("Memory %", style="green")
         
-        for proc in processes[:20]:  # Show top 20
+        for proc in top_processes:
+            cpu_percent = proc['cpu_percent'] or 0
             table.add_row(
                 str(proc['pid']),
-                proc['name'] or 'N/A',
-                f"{proc['cpu_percent'] or 0:.1f}",
-                f"{proc['memory_percent'] or 0:.1f}"
+                Text(proc['name'] or 'N/A'),
+                Text(f"{cpu_percent:.1f}", style=_cpu_style(cpu_percent)),
+                Text(f"{proc['memory_percent'] or 0:.1f}")
             )
         
-        console.print(table)
+        get_console().print(table)
         
     except Exception as e:
         print_error(f"Error listing processes: {e}")
@@ -5,30 +5,81 @@ Service management commands (Redis, databases, etc.).
 import click
 import redis
 import subprocess
+import threading
 from rich.table import Table
-from rich import print as rprint
 
 from instancehub.utils.output import (
-    console, print_success, print_error, print_warning, 
+    get_console, print_success, print_error, print_warning, print_info,
     create_table, format_bytes
 )
-from instancehub.core.services import RedisManager, ServiceHealthChecker
+from instancehub.core.services import RedisManager, ServiceHealthChecker, PARSER_NAME
+from instancehub.config.manager import ConfigManager
 
 @click.group()
 def services():
     """Manage services like Redis, databases, etc."""
     pass
 
+# Seconds before a running redis-benchmark is killed
+BENCHMARK_TIMEOUT = 300
+
+# Per-probe timeout in seconds when the config does not set a valid one
+DEFAULT_HEALTH_TIMEOUT = 5
+
+def _stream_command(cmd, timeout):
+    """
+    Run cmd, echoing its stdout line by line as it is produced.
+    
+    Output is read as bytes and split on newlines only. Carriage-return
+    progress updates within a line (as redis-benchmark writes them) are
+    dropped, and only the text after the last one is shown. stderr is
+    drained on a separate thread so a chatty child cannot fill that pipe
+    and block.
+    
+    Returns (returncode, stderr). Raises subprocess.TimeoutExpired if the
+    process is still running after timeout seconds; it is killed first.
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    timed_out = threading.Event()
+    
+    def kill():
+        timed_out.set()
+        proc.kill()
+    
+    stderr_chunks = []
+    stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+    
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    try:
+        with proc:
+            stderr_reader.start()
+            for line in proc.stdout:
+                text = line.decode(errors='replace').rstrip('\r\n').rsplit('\r', 1)[-1]
+                get_console().out(text, highlight=False)
+            stderr_reader.join()
+    finally:
+        timer.cancel()
+    
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return proc.returncode, b''.join(stderr_chunks).decode(errors='replace')
+
+def redis_connection_options(f):
+    """Add the --host/--port/--password/--db options shared by Redis commands."""
+    f = click.option('--db', default=0, help='Redis database number')(f)
+    f = click.option('--password', help='Redis password')(f)
+    f = click.option('--port', '-p', default=6379, help='Redis port')(f)
+    f = click.option('--host', '-h', default='localhost', help='Redis host')(f)
+    return f
+
 @services.group()
 def redis():
     """Redis service management."""
     pass
 
 @redis.command()
-@click.option('--host', '-h', default='localhost', help='Redis host')
-@click.option('--port', '-p', default=6379, help='Redis port')
-@click.option('--password', help='Redis password')
-@click.option('--db', default=0, help='Redis database number')
+@redis_connection_options
 def status(host, port, password, db):
     """Check Redis server status and get information."""
     try:
@@ -39,56 +90,46 @@ def status(host, port, password, db):
             print_error("Could not connect to Redis server.")
             return
         
-        # Server Information
-        server_table = Table(title="Redis Server Information")
-        server_table.add_column("Property", style="cyan")
-        server_table.add_column("Value", style="white")
-        
-        server_table.add_row("Version", info.get('redis_version', 'N/A'))
-        server_table.add_row("Mode", info.get('redis_mode', 'N/A'))
-        server_table.add_row("OS", info.get('os', 'N/A'))
-        server_table.add_row("Uptime", f"{info.get('uptime_in_seconds', 0)} seconds")
-        server_table.add_row("Connected Clients", str(info.get('connected_clients', 0)))
-        
-        # Memory Information
-        memory_table = Table(title="Redis Memory Information")
-        memory_table.add_column("Property", style="cyan")
-        memory_table.add_column("Value", style="white")
-        
-        used_memory = info.get('used_memory', 0)
-        used_memory_human = info.get('used_memory_human', 'N/A')
-        used_memory_peak = info.get('used_memory_peak', 0)
-        used_memory_peak_human = info.get('used_memory_peak_human', 'N/A')
-        
-        memory_table.add_row("Used Memory", used_memory_human)
-        memory_table.add_row("Peak Memory", used_memory_peak_human)
-        memory_table.add_row("Memory Fragmentation", str(info.get('mem_fragmentation_ratio', 'N/A')))
-        
-        # Stats Information
-        stats_table = Table(title="Redis Statistics")
-        stats_table.add_column("Property", style="cyan")
-        stats_table.add_column("Value", style="white")
-        
-        stats_table.add_row("Total Commands", str(info.get('total_commands_processed', 0)))
-        stats_table.add_row("Commands/sec", str(info.get('instantaneous_ops_per_sec', 0)))
-        stats_table.add_row("Keyspace Hits", str(info.get('keyspace_hits', 0)))
-        stats_table.add_row("Keyspace Misses", str(info.get('keyspace_misses', 0)))
-        stats_table.add_row("Total Keys", str(redis_manager.get_total_keys()))
-        
-        console.print(server_table)
-        console.print(memory_table)
-        console.print(stats_table)
+        # Server, memory and stats tables are laid out and written in one print
+        get_console().print(
+            _property_table("Redis Server Information", [
+                ("Version", info.get('redis_version', 'N/A')),
+                ("Mode", info.get('redis_mode', 'N/A')),
+                ("OS", info.get('os', 'N/A')),
+                ("Uptime", f"{info.get('uptime_in_seconds', 0)} seconds"),
+                ("Connected Clients", str(info.get('connected_clients', 0))),
+                ("Client Parser", PARSER_NAME),
+            ]),
+            _property_table("Redis Memory Information", [
+                ("Used Memory", info.get('used_memory_human', 'N/A')),
+                ("Peak Memory", info.get('used_memory_peak_human', 'N/A')),
+                ("Memory Fragmentation", str(info.get('mem_fragmentation_ratio', 'N/A'))),
+            ]),
+            _property_table("Redis Statistics", [
+                ("Total Commands", str(info.get('total_commands_processed', 0))),
+                ("Commands/sec", str(info.get('instantaneous_ops_per_sec', 0))),
+                ("Keyspace Hits", str(info.get('keyspace_hits', 0))),
+                ("Keyspace Misses", str(info.get('keyspace_misses', 0))),
+                ("Total Keys", str(redis_manager.get_total_keys())),
+            ]),
+        )
         
         print_success(f"Successfully connected to Redis at {host}:{port}")
         
     except Exception as e:
         print_error(f"Error connecting to Redis: {e}")
 
+def _property_table(title, rows):
+    """Build a Property/Value table from (property, value) rows."""
+    table = Table(title=title)
+    table.add_column("Property", style="cyan")
+    table.add_column("Value", style="white")
+    for row in rows:
+        table.add_row(*row)
+    return table
+
 @redis.command()
-@click.option('--host', '-h', default='localhost', help='Redis host')
-@click.option('--port', '-p', default=6379, help='Redis port')
-@click.option('--password', help='Redis password')
-@click.option('--db', default=0, help='Redis database number')
+@redis_connection_options
 def test(host, port, password, db):
     """Test Redis connection."""
     try:
@@ -117,17 +158,14 @@ def test(host, port, password, db):
         print_error(f"Error testing Redis connection: {e}")
 
 @redis.command()
-@click.option('--host', '-h', default='localhost', help='Redis host')
-@click.option('--port', '-p', default=6379, help='Redis port')
-@click.option('--password', help='Redis password')
-@click.option('--db', default=0, help='Redis database number')
+@redis_connection_options
 @click.option('--pattern', default='*', help='Key pattern to match')
 @click.option('--limit', default=100, help='Maximum number of keys to show')
 def keys(host, port, password, db, pattern, limit):
     """List Redis keys matching pattern."""
     try:
         redis_manager = RedisManager(host, port, password, db)
-        keys_list = redis_manager.get_keys(pattern, limit)
+        keys_list = redis_manager.get_keys_with_metadata(pattern, limit)
         
         if not keys_list:
             print_warning(f"No keys found matching pattern: {pattern}")
@@ -137,31 +175,33 @@ def keys(host, port, password, db, pattern, limit):
         table.add_column("Key", style="cyan")
         table.add_column("Type", style="yellow")
         table.add_column("TTL", style="green")
+        table.add_column("Memory", style="magenta")
         
-        for key in keys_list:
-            key_type = redis_manager.get_key_type(key)
-            ttl = redis_manager.get_key_ttl(key)
+        for key, key_type, ttl, memory in keys_list:
             ttl_str = str(ttl) if ttl > 0 else "No expiry" if ttl == -1 else "Expired"
+            memory_str = format_bytes(memory) if memory is not None else "N/A"
             
-            table.add_row(key, key_type, ttl_str)
+            table.add_row(key, key_type, ttl_str, memory_str)
         
-        console.print(table)
+        get_console().print(table)
         print_info(f"Showing {len(keys_list)} keys (limit: {limit})")
         
     except Exception as e:
         print_error(f"Error listing Redis keys: {e}")
 
 @redis.command()
-@click.option('--host', '-h', default='localhost', help='Redis host')
-@click.option('--port', '-p', default=6379, help='Redis port')
-@click.option('--password', help='Redis password')
+@redis_connection_options
 @click.option('--clients', '-c', default=1, help='Number of clients')
 @click.option('--requests', '-n', default=10000, help='Number of requests')
 @click.option('--data-size', '-d', default=100, help='Data size in bytes')
-def benchmark(host, port, password, clients, requests, data_size):
+@click.option('--pipeline', '-P', default=1, help='Pipeline depth (requests per round trip)')
+@click.option('--threads', default=1, help='Benchmark client threads (Redis 6+)')
+@click.option('--tests', '-t', default='get,set,incr', help='Comma-separated list of tests to run')
+def benchmark(host, port, password, db, clients, requests, data_size, pipeline, threads, tests):
     """Run Redis benchmark test."""
     try:
-        print_info(f"Running Redis benchmark: {clients} clients, {requests} requests, {data_size} bytes data")
+        print_info(f"Running Redis benchmark: {clients} clients, {requests} requests, {data_size} bytes data, "
+                   f"pipeline depth {pipeline}")
         
         cmd = [
             'redis-benchmark',
@@ -169,19 +209,26 @@ def benchmark(host, port, password, clients, requests, data_size):
             '-p', str(port),
             '-c', str(clients),
             '-n', str(requests),
-            '-d', str(data_size)
+            '-d', str(data_size),
+            '-P', str(pipeline),
+            '-t', tests
         ]
         
+        if threads > 1:
+            cmd.extend(['--threads', str(threads)])
+        
+        if db:
+            cmd.extend(['--dbnum', str(db)])
+        
         if password:
             cmd.extend(['-a', password])
         
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+        returncode, stderr = _stream_command(cmd, BENCHMARK_TIMEOUT)
         
-        if result.returncode == 0:
+        if returncode == 0:
             print_success("Benchmark completed successfully")
-            console.print(result.stdout)
         else:
-            print_error(f"Benchmark failed: {result.stderr}")
+            print_error(f"Benchmark failed: {stderr}")
             
     except subprocess.TimeoutExpired:
         print_error("Benchmark timed out after 5 minutes")
@@ -190,26 +237,77 @@ def benchmark(host, port, password, clients, requests, data_size):
     except Exception as e:
         print_error(f"Error running benchmark: {e}")
 
+def _health_check_options():
+    """
+    Read the health-check timeout and port overrides from the configuration.
+    
+    An unreadable config or invalid values fall back to the built-in
+    defaults with a warning, so health checks never depend on the config.
+    """
+    options = {'timeout': DEFAULT_HEALTH_TIMEOUT, 'default_ports': {}}
+    try:
+        config_manager = ConfigManager()
+        timeout = config_manager.get_value('services.health_check_timeout', DEFAULT_HEALTH_TIMEOUT)
+        default_ports = config_manager.get_value('services.default_ports', {})
+    except Exception as e:
+        print_warning(f"Ignoring configuration: {e}")
+        return options
+    
+    if isinstance(timeout, (int, float)) and not isinstance(timeout, bool) and timeout > 0:
+        options['timeout'] = timeout
+    else:
+        print_warning(f"Invalid services.health_check_timeout {timeout!r}, using {DEFAULT_HEALTH_TIMEOUT}s")
+    
+    if isinstance(default_ports, dict):
+        options['default_ports'] = {
+            name: port for name, port in default_ports.items()
+            if isinstance(port, int) and not isinstance(port, bool) and 0 < port < 65536
+        }
+        if len(options['default_ports']) != len(default_ports):
+            print_warning("Ignoring invalid entries in services.default_ports")
+    else:
+        print_warning("Invalid services.default_ports, using built-in ports")
+    return options
+
 @services.command()
 @click.option('--service', '-s', multiple=True, help='Service to check (can be used multiple times)')
-def health(service):
+@click.option('--host', '-H', 'hosts', multiple=True, default=['localhost'],
+              help='Host to check (can be used multiple times)')
+@click.option('--deep', is_flag=True, help='Run protocol-level checks instead of a TCP probe only')
+def health(service, hosts, deep):
     """Check health of various services."""
-    health_checker = ServiceHealthChecker()
+    checker_options = _health_check_options()
     
     services_to_check = list(service) if service else ['redis', 'postgresql', 'mysql', 'mongodb']
     
+    if len(hosts) > 1:
+        # Many endpoints: multiplex every probe on one event loop
+        from instancehub.core.services_async import AsyncServiceHealthChecker
+        results = AsyncServiceHealthChecker(**checker_options).check_fleet(
+            services_to_check, list(hosts), deep=deep
+        )
+    else:
+        health_checker = ServiceHealthChecker(**checker_options)
+        results = {
+            (svc, hosts[0]): result
+            for svc, result in health_checker.check_multiple_services(services_to_check, hosts[0], deep=deep).items()
+        }
+    
     table = Table(title="Service Health Check")
     table.add_column("Service", style="cyan")
+    if len(hosts) > 1:
+        table.add_column("Host", style="blue")
     table.add_column("Status", style="white")
     table.add_column("Details", style="yellow")
     
-    for svc in services_to_check:
-        status, details = health_checker.check_service(svc)
+    for (svc, host), (status, details) in results.items():
         status_color = "green" if status == "healthy" else "red"
+        host_cell = [host] if len(hosts) > 1 else []
         table.add_row(
             svc.title(),
+            *host_cell,
             f"[{status_color}]{status}[/{status_color}]",
             details
         )
     
-    console.print(table)
+    get_console().print(table)
@@ -2,10 +2,119 @@
 Configuration management functionality.
 """
 
+import copy
+import functools
 import os
 import yaml
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
+
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# Expected shape of the configuration, checked in a single walk by
+# ConfigManager.validate_config. Uses a small subset of JSON Schema.
+CONFIG_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'aws': {
+            'type': 'object',
+            'required': ['default_region'],
+            'properties': {
+                'default_region': {'type': 'string', 'minLength': 1},
+            },
+        },
+        'monitoring': {
+            'type': 'object',
+            'properties': {
+                'cpu_threshold': {'type': 'number', 'minimum': 0, 'maximum': 100},
+                'memory_threshold': {'type': 'number', 'minimum': 0, 'maximum': 100},
+                'disk_threshold': {'type': 'number', 'minimum': 0, 'maximum': 100},
+            },
+        },
+        'redis': {
+            'type': 'object',
+            'properties': {
+                'default_port': {'type': 'integer', 'minimum': 1, 'maximum': 65535},
+            },
+        },
+    },
+}
+
+_SCHEMA_TYPES = {
+    'object': dict,
+    'integer': int,
+    'number': (int, float),
+    'string': str,
+}
+
+def _validate_node(schema: Dict[str, Any], value: Any, path: str, errors: list,
+                   check_required: bool = True) -> None:
+    """Validate a value against a schema node, appending messages to errors."""
+    expected = schema.get('type')
+    if expected and (isinstance(value, bool) or not isinstance(value, _SCHEMA_TYPES[expected])):
+        if 'minimum' in schema and 'maximum' in schema:
+            errors.append(f"Invalid {path}: must be between {schema['minimum']} and {schema['maximum']}")
+        else:
+            errors.append(f"Invalid {path}: must be of type {expected}")
+        return
+    
+    if 'minimum' in schema and 'maximum' in schema:
+        if value < schema['minimum'] or value > schema['maximum']:
+            errors.append(f"Invalid {path}: must be between {schema['minimum']} and {schema['maximum']}")
+    
+    if 'minLength' in schema and len(value.strip()) < schema['minLength']:
+        errors.append(f"Invalid {path}: must not be empty")
+    
+    missing = set()
+    for key in schema.get('required', []) if check_required else []:
+        # A required key set to null or an empty string counts as missing
+        if value.get(key) in (None, ''):
+            missing.add(key)
+            errors.append(f"Missing {path}.{key}" if path else f"Missing {key}")
+    
+    for key, child in schema.get('properties', {}).items():
+        child_path = f"{path}.{key}" if path else key
+        if key in value and key not in missing:
+            _validate_node(child, value[key], child_path, errors, check_required)
+        elif check_required and child.get('required'):
+            # An absent section still reports the keys it must contain
+            _validate_node(child, {}, child_path, errors)
+
+def schema_errors(config: Dict[str, Any], check_required: bool = True) -> List[str]:
+    """Return every way in which config violates CONFIG_SCHEMA.
+    
+    With check_required=False only the values that are present are checked,
+    which lets a partial configuration be built up one key at a time.
+    """
+    errors = []
+    _validate_node(CONFIG_SCHEMA, config, '', errors, check_required)
+    return errors
+
+def flatten_config(config: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+    """Flatten nested sections into a dict keyed by dot-notation paths."""
+    flat = {}
+    for key, value in config.items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        flat[path] = value
+        if isinstance(value, dict):
+            flat.update(flatten_config(value, path))
+    return flat
+
+@functools.lru_cache(maxsize=1)
+def _parse_config(path: str, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
+    """Parse a config file; cached on its path, mtime and size."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+@functools.lru_cache(maxsize=1)
+def _config_index(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Dot-notation index over a parsed config file; cached like _parse_config."""
+    config = _parse_config(path, mtime_ns, size)
+    return flatten_config(config) if isinstance(config, dict) else {}
 
 class ConfigManager:
     """Manages InstanceHub configuration."""
@@ -27,57 +136,85 @@ class ConfigManager:
         """Check if configuration file exists."""
         return self.config_path.exists()
     
-    def load_config(self) -> Optional[Dict[str, Any]]:
-        """Load configuration from file."""
+    def _cache_key(self) -> Optional[tuple]:
+        """Return the (path, mtime_ns, size) key for the parse caches, or None if there is no file."""
         if not self.config_exists():
             return None
-        
+        st = self.config_path.stat()
+        return str(self.config_path), st.st_mtime_ns, st.st_size
+    
+    def _cached_config(self) -> Optional[Dict[str, Any]]:
+        """Return the shared parsed configuration; callers must not mutate it."""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            key = self._cache_key()
+            return _parse_config(*key) if key else None
         except Exception as e:
             raise Exception(f"Failed to load configuration: {e}")
     
+    def load_config(self) -> Optional[Dict[str, Any]]:
+        """Load configuration from file."""
+        config = self._cached_config()
+        # Hand out a copy so callers can mutate it without touching the cache
+        return copy.deepcopy(config)
+    
     def save_config(self, config: Dict[str, Any]) -> None:
-        """Save configuration to file."""
+        """Save configuration to file, rejecting values that fail validation."""
+        errors = schema_errors(config, check_required=False)
+        if errors:
+            raise Exception(f"Invalid configuration: {'; '.join(errors)}")
+        
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config, f, default_flow_style=False, indent=2)
+            content = yaml.dump(config, Dumper=SafeDumper, default_flow_style=False, indent=2).encode('utf-8')
+            
+            # Leave the file (and its mtime-keyed parse cache) alone if nothing changed
+            if self.config_exists() and self.config_path.read_bytes() == content:
+                return
+            
+            # Write a temporary file and swap it in so readers never see a partial config
+            tmp_path = self.config_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_path)
         except Exception as e:
             raise Exception(f"Failed to save configuration: {e}")
     
     def get_value(self, key: str, default: Any = None) -> Any:
         """Get a configuration value using dot notation."""
-        config = self.load_config()
-        if not config:
-            return default
-        
-        keys = key.split('.')
-        current = config
+        try:
+            key_info = self._cache_key()
+            # One dict lookup per call; the index is rebuilt only when the file changes
+            index = _config_index(*key_info) if key_info else {}
+        except Exception as e:
+            raise Exception(f"Failed to load configuration: {e}")
         
-        for k in keys:
-            if isinstance(current, dict) and k in current:
-                current = current[k]
-            else:
-                return default
+        if key not in index:
+            return default
         
-        return current
+        # Only the requested subtree is copied, not the whole configuration
+        return copy.deepcopy(index[key])
     
     def set_value(self, key: str, value: Any) -> None:
         """Set a configuration value using dot notation."""
+        self.set_values({key: value})
+    
+    def set_values(self, values: Dict[str, Any]) -> None:
+        """Set several dot-notation values with a single load and save."""
         config = self.load_config() or {}
         
-        keys = key.split('.')
-        current = config
-        
-        # Navigate to the parent of the target key
-        for k in keys[:-1]:
-            if k not in current:
-                current[k] = {}
-            current = current[k]
-        
-        # Set the value
-        current[keys[-1]] = value
+        for key, value in values.items():
+            keys = key.split('.')
+            current = config
+            
+            # Navigate to the parent of the target key
+            for k in keys[:-1]:
+                if k not in current:
+                    current[k] = {}
+                current = current[k]
+            
+            # Set the value
+            current[keys[-1]] = value
         
         self.save_config(config)
     
@@ -175,26 +312,5 @@ class ConfigManager:
         if not config:
             return False, ["No configuration found"]
         
-        errors = []
-        
-        # Validate AWS configuration
-        aws_config = config.get('aws', {})
-        if not aws_config.get('default_region'):
-            errors.append("Missing aws.default_region")
-        
-        # Validate monitoring thresholds
-        monitoring_config = config.get('monitoring', {})
-        for threshold in ['cpu_threshold', 'memory_threshold', 'disk_threshold']:
-            value = monitoring_config.get(threshold)
-            if value is not None:
-                if not isinstance(value, (int, float)) or value < 0 or value > 100:
-                    errors.append(f"Invalid {threshold}: must be between 0 and 100")
-        
-        # Validate Redis configuration
-        redis_config = config.get('redis', {})
-        port = redis_config.get('default_port')
-        if port is not None:
-            if not isinstance(port, int) or port < 1 or port > 65535:
-                errors.append("Invalid redis.default_port: must be between 1 and 65535")
-        
+        errors = schema_errors(config)
         return len(errors) == 0, errors
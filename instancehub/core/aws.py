@@ -2,10 +2,44 @@
 AWS EC2 management core functionality.
 """
 
-import boto3
+import functools
 import time
 from botocore.exceptions import ClientError
-from typing import List, Dict, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+# Poll every 15 seconds for up to 10 minutes
+WAITER_CONFIG = {'Delay': 15, 'MaxAttempts': 40}
+
+# After a reboot, poll for the status checks to leave 'ok' before waiting for
+# them to pass again; give up on seeing the transition after the timeout
+REBOOT_POLL_INTERVAL = 5
+REBOOT_TRANSITION_TIMEOUT = 120
+
+# Maximum explicit instance IDs accepted by a single API call
+DESCRIBE_INSTANCES_BATCH = 1000
+DESCRIBE_STATUS_BATCH = 100
+
+@functools.lru_cache(maxsize=1)
+def _session():
+    """Return the process-wide boto3 session."""
+    # boto3 takes a noticeable fraction of a second to import, so it is only
+    # loaded once a client is actually needed
+    import boto3
+    return boto3.session.Session()
+
+@functools.lru_cache(maxsize=8)
+def _ec2_client(region: str):
+    """Return a cached EC2 client for the region."""
+    return _session().client('ec2', region_name=region)
+
+def _as_id_list(instance_ids: Union[str, List[str]]) -> List[str]:
+    """Normalize a single instance ID or a list of IDs to a list."""
+    return [instance_ids] if isinstance(instance_ids, str) else list(instance_ids)
+
+def _chunks(items: List[str], size: int) -> Iterator[List[str]]:
+    """Yield consecutive slices of at most size items."""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
 
 class EC2Manager:
     """Manages AWS EC2 instances."""
@@ -13,21 +47,48 @@ class EC2Manager:
     def __init__(self, region: str = 'us-east-1'):
         """Initialize EC2 manager with specified region."""
         self.region = region
-        self.ec2_client = boto3.client('ec2', region_name=region)
-        self.ec2_resource = boto3.resource('ec2', region_name=region)
+        self._ec2_client = None
+    
+    @property
+    def ec2_client(self):
+        """EC2 client for the region, created on first use."""
+        if self._ec2_client is None:
+            self._ec2_client = _ec2_client(self.region)
+        return self._ec2_client
     
     def list_instances(self, state_filter: Optional[str] = None, 
-                      tag_filter: Optional[str] = None) -> List[Dict]:
+                      tag_filter: Optional[str] = None,
+                      limit: Optional[int] = None) -> List[Dict]:
         """
         List EC2 instances with optional filtering.
         
         Args:
             state_filter: Filter by instance state (running, stopped, etc.)
             tag_filter: Filter by tag in format 'key=value'
+            limit: Maximum number of instances to return
         
         Returns:
             List of instance dictionaries
         """
+        return list(self.iter_instances(state_filter, tag_filter, limit))
+    
+    def iter_instances(self, state_filter: Optional[str] = None,
+                       tag_filter: Optional[str] = None,
+                       limit: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Iterate over EC2 instances one page at a time.
+        
+        Filters are applied server-side, so only matching instances are
+        transferred, and only one page of results is held in memory.
+        
+        Args:
+            state_filter: Filter by instance state (running, stopped, etc.)
+            tag_filter: Filter by tag in format 'key=value'
+            limit: Stop after this many instances; no further pages are requested
+        
+        Yields:
+            Instance dictionaries
+        """
         filters = []
         
         if state_filter:
@@ -38,100 +99,152 @@ class EC2Manager:
             filters.append({'Name': f'tag:{key}', 'Values': [value]})
         
         try:
-            if filters:
-                response = self.ec2_client.describe_instances(Filters=filters)
-            else:
-                response = self.ec2_client.describe_instances()
+            # DescribeInstances accepts page sizes between 5 and 1000
+            page_size = max(5, min(limit, 1000)) if limit else 1000
+            paginator = self.ec2_client.get_paginator('describe_instances')
+            pages = paginator.paginate(Filters=filters, PaginationConfig={'PageSize': page_size})
             
-            instances = []
-            for reservation in response['Reservations']:
-                for instance in reservation['Instances']:
-                    instance_data = {
-                        'id': instance['InstanceId'],
-                        'name': self._get_instance_name(instance),
-                        'state': instance['State']['Name'],
-                        'type': instance['InstanceType'],
-                        'public_ip': instance.get('PublicIpAddress'),
-                        'private_ip': instance.get('PrivateIpAddress'),
-                        'launch_time': instance.get('LaunchTime'),
-                        'vpc_id': instance.get('VpcId'),
-                        'subnet_id': instance.get('SubnetId')
-                    }
-                    instances.append(instance_data)
-            
-            return instances
+            remaining = limit or None
+            for page in pages:
+                for reservation in page['Reservations']:
+                    for instance in reservation['Instances']:
+                        yield {
+                            'id': instance['InstanceId'],
+                            'name': self._get_instance_name(instance),
+                            'state': instance['State']['Name'],
+                            'type': instance['InstanceType'],
+                            'public_ip': instance.get('PublicIpAddress'),
+                            'private_ip': instance.get('PrivateIpAddress'),
+                            'launch_time': instance.get('LaunchTime'),
+                            'vpc_id': instance.get('VpcId'),
+                            'subnet_id': instance.get('SubnetId')
+                        }
+                        if remaining is not None:
+                            remaining -= 1
+                            if remaining <= 0:
+                                return
             
         except ClientError as e:
             raise Exception(f"Failed to list instances: {e}")
     
-    def start_instance(self, instance_id: str, wait: bool = False) -> bool:
+    def start_instance(self, instance_ids: Union[str, List[str]], wait: bool = False) -> bool:
         """
-        Start an EC2 instance.
+        Start one or more EC2 instances with a single API call.
         
         Args:
-            instance_id: The instance ID to start
-            wait: Whether to wait for the instance to be running
+            instance_ids: The instance ID, or list of IDs, to start
+            wait: Whether to wait for the instances to be running
         
         Returns:
             True if successful, False otherwise
         """
+        ids = _as_id_list(instance_ids)
         try:
-            self.ec2_client.start_instances(InstanceIds=[instance_id])
+            # Starting a running instance is a no-op; skip it in the API call
+            states = self.get_instance_states(ids)
+            pending = [i for i in ids if states.get(i) != 'running']
+            if pending:
+                self.ec2_client.start_instances(InstanceIds=pending)
             
             if wait:
-                waiter = self.ec2_client.get_waiter('instance_running')
-                waiter.wait(InstanceIds=[instance_id])
+                self._wait_for('instance_running', ids)
             
             return True
             
         except ClientError as e:
-            raise Exception(f"Failed to start instance {instance_id}: {e}")
+            raise Exception(f"Failed to start instance {', '.join(ids)}: {e}")
     
-    def stop_instance(self, instance_id: str, wait: bool = False) -> bool:
+    def stop_instance(self, instance_ids: Union[str, List[str]], wait: bool = False) -> bool:
         """
-        Stop an EC2 instance.
+        Stop one or more EC2 instances with a single API call.
         
         Args:
-            instance_id: The instance ID to stop
-            wait: Whether to wait for the instance to be stopped
+            instance_ids: The instance ID, or list of IDs, to stop
+            wait: Whether to wait for the instances to be stopped
         
         Returns:
             True if successful, False otherwise
         """
+        ids = _as_id_list(instance_ids)
         try:
-            self.ec2_client.stop_instances(InstanceIds=[instance_id])
+            # Stopping a stopped instance is a no-op; skip it in the API call
+            states = self.get_instance_states(ids)
+            pending = [i for i in ids if states.get(i) != 'stopped']
+            if pending:
+                self.ec2_client.stop_instances(InstanceIds=pending)
             
             if wait:
-                waiter = self.ec2_client.get_waiter('instance_stopped')
-                waiter.wait(InstanceIds=[instance_id])
+                self._wait_for('instance_stopped', ids)
             
             return True
             
         except ClientError as e:
-            raise Exception(f"Failed to stop instance {instance_id}: {e}")
+            raise Exception(f"Failed to stop instance {', '.join(ids)}: {e}")
     
     def restart_instance(self, instance_id: str, wait: bool = False) -> bool:
         """
         Restart an EC2 instance.
         
+        A running instance is rebooted in place, which is much faster than a
+        stop/start cycle; an instance that is not running is simply started.
+        
         Args:
             instance_id: The instance ID to restart
-            wait: Whether to wait for the restart to complete
+            wait: Whether to wait for the restart to complete. The instance
+                status is first polled until it leaves 'ok' (the reboot has
+                begun), then until it is 'ok' again. A reboot quick enough
+                that the transition is never observed within
+                REBOOT_TRANSITION_TIMEOUT makes this best-effort.
         
         Returns:
             True if successful, False otherwise
         """
         try:
-            # First stop the instance
-            self.stop_instance(instance_id, wait=True)
-            # Then start it again
-            self.start_instance(instance_id, wait=wait)
+            if self.get_instance_state(instance_id) != 'running':
+                return self.start_instance(instance_id, wait=wait)
+            
+            self.ec2_client.reboot_instances(InstanceIds=[instance_id])
+            
+            if wait:
+                self._wait_for_status_change(instance_id, 'ok')
+                self._wait_for('instance_status_ok', instance_id)
             
             return True
             
         except Exception as e:
             raise Exception(f"Failed to restart instance {instance_id}: {e}")
     
+    def get_instance_state(self, instance_id: str) -> Optional[str]:
+        """
+        Get the current state name of an instance.
+        
+        Args:
+            instance_id: The instance ID to look up
+        
+        Returns:
+            State name (running, stopped, etc.) or None if not found
+        """
+        return self.get_instance_states([instance_id]).get(instance_id)
+    
+    def get_instance_states(self, instance_ids: List[str]) -> Dict[str, str]:
+        """
+        Get the current state names of several instances.
+        
+        Args:
+            instance_ids: The instance IDs to look up
+        
+        Returns:
+            Dictionary mapping instance ID to state name; unknown IDs are omitted
+        """
+        states = {}
+        for chunk in _chunks(instance_ids, DESCRIBE_STATUS_BATCH):
+            response = self.ec2_client.describe_instance_status(
+                InstanceIds=chunk, IncludeAllInstances=True
+            )
+            for status in response['InstanceStatuses']:
+                states[status['InstanceId']] = status['InstanceState']['Name']
+        return states
+    
     def get_instance_details(self, instance_id: str) -> Optional[Dict]:
         """
         Get detailed information about an instance.
@@ -142,35 +255,73 @@ class EC2Manager:
         Returns:
             Dictionary with instance details or None if not found
         """
+        return self.get_instance_details_bulk([instance_id]).get(instance_id)
+    
+    def get_instance_details_bulk(self, instance_ids: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Get detailed information about several instances.
+        
+        Instances are described up to DESCRIBE_INSTANCES_BATCH IDs per call.
+        
+        Args:
+            instance_ids: The instance IDs to get details for
+        
+        Returns:
+            Dictionary mapping instance ID to its details; unknown IDs are omitted
+        """
+        details = {}
         try:
-            response = self.ec2_client.describe_instances(InstanceIds=[instance_id])
-            
-            if not response['Reservations']:
-                return None
-            
-            instance = response['Reservations'][0]['Instances'][0]
-            
-            details = {
-                'Instance ID': instance['InstanceId'],
-                'Name': self._get_instance_name(instance),
-                'State': instance['State']['Name'],
-                'Instance Type': instance['InstanceType'],
-                'Public IP': instance.get('PublicIpAddress', 'N/A'),
-                'Private IP': instance.get('PrivateIpAddress', 'N/A'),
-                'VPC ID': instance.get('VpcId', 'N/A'),
-                'Subnet ID': instance.get('SubnetId', 'N/A'),
-                'Security Groups': ', '.join([sg['GroupName'] for sg in instance.get('SecurityGroups', [])]),
-                'Launch Time': str(instance.get('LaunchTime', 'N/A')),
-                'Architecture': instance.get('Architecture', 'N/A'),
-                'Platform': instance.get('Platform', 'Linux'),
-                'Monitoring': instance.get('Monitoring', {}).get('State', 'N/A')
-            }
-            
+            for chunk in _chunks(_as_id_list(instance_ids), DESCRIBE_INSTANCES_BATCH):
+                response = self.ec2_client.describe_instances(InstanceIds=chunk)
+                for reservation in response['Reservations']:
+                    for instance in reservation['Instances']:
+                        details[instance['InstanceId']] = self._format_details(instance)
             return details
             
         except ClientError as e:
             raise Exception(f"Failed to get instance details: {e}")
     
+    def _format_details(self, instance: Dict) -> Dict:
+        """Build the display dictionary for a describe_instances entry."""
+        return {
+            'Instance ID': instance['InstanceId'],
+            'Name': self._get_instance_name(instance),
+            'State': instance['State']['Name'],
+            'Instance Type': instance['InstanceType'],
+            'Public IP': instance.get('PublicIpAddress', 'N/A'),
+            'Private IP': instance.get('PrivateIpAddress', 'N/A'),
+            'VPC ID': instance.get('VpcId', 'N/A'),
+            'Subnet ID': instance.get('SubnetId', 'N/A'),
+            'Security Groups': ', '.join([sg['GroupName'] for sg in instance.get('SecurityGroups', [])]),
+            'Launch Time': str(instance.get('LaunchTime', 'N/A')),
+            'Architecture': instance.get('Architecture', 'N/A'),
+            'Platform': instance.get('Platform', 'Linux'),
+            'Monitoring': instance.get('Monitoring', {}).get('State', 'N/A')
+        }
+    
+    def _instance_status(self, instance_id: str) -> Optional[str]:
+        """Return the instance status check summary ('ok', 'initializing', ...)."""
+        response = self.ec2_client.describe_instance_status(
+            InstanceIds=[instance_id], IncludeAllInstances=True
+        )
+        for status in response['InstanceStatuses']:
+            return status.get('InstanceStatus', {}).get('Status')
+        return None
+    
+    def _wait_for_status_change(self, instance_id: str, status: str) -> bool:
+        """Poll until the instance status differs from status; False on timeout."""
+        deadline = time.monotonic() + REBOOT_TRANSITION_TIMEOUT
+        while self._instance_status(instance_id) == status:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(REBOOT_POLL_INTERVAL)
+        return True
+    
+    def _wait_for(self, waiter_name: str, instance_ids: Union[str, List[str]]) -> None:
+        """Block on a boto3 waiter until the instances reach the target state."""
+        waiter = self.ec2_client.get_waiter(waiter_name)
+        waiter.wait(InstanceIds=_as_id_list(instance_ids), WaiterConfig=WAITER_CONFIG)
+    
     def _get_instance_name(self, instance: Dict) -> str:
         """Extract instance name from tags."""
         tags = instance.get('Tags', [])
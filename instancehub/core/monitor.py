@@ -2,14 +2,130 @@
 System monitoring core functionality.
 """
 
+import heapq
 import psutil
+import os
+import signal
+import sys
+import threading
 import time
-from typing import Dict, List, Optional
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
 from dataclasses import dataclass
 
-@dataclass
+# Attributes reported for each process by get_process_list
+PROCESS_ATTRS = ['pid', 'name', 'cpu_percent', 'memory_percent', 'status']
+PROCESS_SORT_KEYS = ('cpu_percent', 'memory_percent')
+
+# Kernel socket summaries and the fields that count towards open inet sockets
+SOCKSTAT_FILES = ('/proc/net/sockstat', '/proc/net/sockstat6')
+SOCKSTAT_FIELDS = {
+    'TCP': ('inuse', 'tw'),
+    'UDP': ('inuse',),
+    'TCP6': ('inuse',),
+    'UDP6': ('inuse',),
+}
+
+def _count_inet_sockets() -> int:
+    """
+    Count open TCP/UDP sockets.
+    
+    On Linux the kernel's sockstat summaries are read, which costs the same
+    regardless of how many sockets are open; elsewhere every connection is
+    enumerated through psutil.
+    """
+    total = 0
+    found = False
+    for path in SOCKSTAT_FILES:
+        try:
+            with open(path, 'r') as f:
+                lines = f.readlines()
+        except OSError:
+            # sockstat6 is absent when IPv6 is disabled
+            continue
+        found = True
+        for line in lines:
+            protocol, _, values = line.partition(':')
+            fields = SOCKSTAT_FIELDS.get(protocol)
+            if fields:
+                counters = values.split()
+                counts = dict(zip(counters[::2], counters[1::2]))
+                try:
+                    total += sum(int(counts.get(field, 0)) for field in fields)
+                except ValueError:
+                    # Unexpected format; count the slow but reliable way
+                    found = False
+                    break
+        if not found:
+            break
+    
+    if not found:
+        return len(psutil.net_connections(kind='inet'))
+    return total
+
+# Read CPU, memory and disk figures straight from /proc and statvfs on Linux
+USE_PROC = sys.platform.startswith('linux')
+PROC_STAT = '/proc/stat'
+PROC_MEMINFO = '/proc/meminfo'
+
+def _read_proc_cpu_times() -> Optional[tuple]:
+    """Return (busy, total) jiffies from the aggregate line of /proc/stat."""
+    try:
+        with open(PROC_STAT, 'r') as f:
+            fields = [int(value) for value in f.readline().split()[1:9]]
+    except (OSError, ValueError):
+        return None
+    if len(fields) < 8:
+        return None
+    # user nice system idle iowait irq softirq steal; guest time is already in user
+    total = sum(fields)
+    return total - fields[3] - fields[4], total
+
+def _read_proc_memory_percent() -> Optional[float]:
+    """Return used memory percent computed from MemTotal and MemAvailable."""
+    try:
+        meminfo = {}
+        with open(PROC_MEMINFO, 'r') as f:
+            for line in f:
+                name, _, value = line.partition(':')
+                meminfo[name] = int(value.split()[0])
+                if 'MemTotal' in meminfo and 'MemAvailable' in meminfo:
+                    break
+        total = meminfo['MemTotal']
+        return round(100 * (total - meminfo['MemAvailable']) / total, 1)
+    except (OSError, ValueError, IndexError, KeyError, ZeroDivisionError):
+        return None
+
+@contextmanager
+def stop_on_signals(*signums: int) -> Iterator[threading.Event]:
+    """
+    Yield an event that is set when SIGINT/SIGTERM (or the given signals) arrive.
+    
+    Loops wait on the event instead of sleeping, so they exit as soon as the
+    user interrupts them. Previous handlers are restored on exit. Handlers can
+    only be installed from the main thread; elsewhere the event is still
+    returned but only set by the caller.
+    """
+    stop = threading.Event()
+    previous = {}
+    
+    if threading.current_thread() is threading.main_thread():
+        for signum in signums or (signal.SIGINT, signal.SIGTERM):
+            previous[signum] = signal.signal(signum, lambda *_: stop.set())
+    
+    try:
+        yield stop
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+
+@dataclass(frozen=True)
 class SystemStats:
     """System statistics data class."""
+    # Declared by hand because dataclass(slots=True) needs Python 3.10
+    __slots__ = ('cpu_percent', 'memory_percent', 'disk_percent', 'network_sent',
+                 'network_recv', 'uptime', 'processes')
+    
     cpu_percent: float
     memory_percent: float
     disk_percent: float
@@ -17,6 +133,15 @@ class SystemStats:
     network_recv: int
     uptime: float
     processes: int
+    
+    def __getstate__(self):
+        """Return field values for pickling; slotted classes have no __dict__."""
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state):
+        """Restore field values, bypassing the frozen __setattr__."""
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
 class SystemMonitor:
     """System monitoring and alerting."""
@@ -29,19 +154,30 @@ class SystemMonitor:
             'memory': 90,
             'disk': 90
         }
+        # Boot time never changes while the process runs
+        self._boot_time = psutil.boot_time()
+        # Prime the CPU counters so get_system_stats can read a delta without blocking
+        self._prev_cpu = _read_proc_cpu_times() if USE_PROC else None
+        if self._prev_cpu is None:
+            psutil.cpu_percent(interval=None)
     
     def get_system_stats(self) -> SystemStats:
         """Get current system statistics."""
-        # CPU
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # CPU usage since the previous call (non-blocking)
+        cpu_percent = self._cpu_percent()
         
         # Memory
-        memory = psutil.virtual_memory()
-        memory_percent = memory.percent
+        memory_percent = _read_proc_memory_percent() if USE_PROC else None
+        if memory_percent is None:
+            memory_percent = psutil.virtual_memory().percent
         
-        # Disk (root partition)
-        disk = psutil.disk_usage('/')
-        disk_percent = (disk.used / disk.total) * 100
+        # Disk (root partition); statvfs is the same syscall psutil.disk_usage makes
+        disk = os.statvfs('/') if hasattr(os, 'statvfs') else None
+        if disk is not None:
+            disk_percent = (disk.f_blocks - disk.f_bfree) / disk.f_blocks * 100 if disk.f_blocks else 0.0
+        else:
+            usage = psutil.disk_usage('/')
+            disk_percent = (usage.used / usage.total) * 100
         
         # Network
         net_io = psutil.net_io_counters()
@@ -49,8 +185,7 @@ class SystemMonitor:
         network_recv = net_io.bytes_recv
         
         # System
-        boot_time = psutil.boot_time()
-        uptime = time.time() - boot_time
+        uptime = time.time() - self._boot_time
         processes = len(psutil.pids())
         
         return SystemStats(
@@ -63,6 +198,20 @@ class SystemMonitor:
             processes=processes
         )
     
+    def _cpu_percent(self) -> float:
+        """CPU usage percent since the previous call."""
+        if self._prev_cpu is None:
+            return psutil.cpu_percent(interval=None)
+        
+        current = _read_proc_cpu_times()
+        if current is None:
+            return psutil.cpu_percent(interval=None)
+        
+        busy_delta = current[0] - self._prev_cpu[0]
+        total_delta = current[1] - self._prev_cpu[1]
+        self._prev_cpu = current
+        return round(100 * busy_delta / total_delta, 1) if total_delta > 0 else 0.0
+    
     def check_thresholds(self, stats: SystemStats) -> List[str]:
         """Check if any thresholds are exceeded."""
         alerts = []
@@ -132,7 +281,7 @@ class SystemMonitor:
     def get_network_info(self) -> Dict:
         """Get network interface information."""
         net_io = psutil.net_io_counters()
-        net_connections = len(psutil.net_connections())
+        net_connections = _count_inet_sockets()
         
         return {
             'bytes_sent': net_io.bytes_sent,
@@ -142,38 +291,63 @@ class SystemMonitor:
             'connections': net_connections
         }
     
+    def get_connections(self, kind: str = 'inet') -> List:
+        """Get the full socket connection list (expensive on busy hosts)."""
+        return psutil.net_connections(kind=kind)
+    
     def get_process_list(self, sort_by: str = 'cpu_percent', limit: int = 10) -> List[Dict]:
-        """Get list of running processes."""
-        processes = []
+        """
+        Get list of running processes.
         
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'status']):
-            try:
-                proc_info = proc.info
-                proc_info['cpu_percent'] = proc_info['cpu_percent'] or 0
-                proc_info['memory_percent'] = proc_info['memory_percent'] or 0
-                processes.append(proc_info)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+        Only the sort metric is read for every process; the full attribute
+        set is fetched for the top `limit` processes alone.
+        """
+        if sort_by not in PROCESS_SORT_KEYS:
+            processes = []
+            for proc in psutil.process_iter(PROCESS_ATTRS):
+                processes.append(self._process_info(proc.info))
+                if len(processes) >= limit:
+                    break
+            return processes
+        
+        ranked = []
+        for proc in psutil.process_iter([sort_by]):
+            ranked.append((proc.info[sort_by] or 0, proc))
         
-        # Sort processes
-        if sort_by in ['cpu_percent', 'memory_percent']:
-            processes.sort(key=lambda x: x[sort_by], reverse=True)
+        processes = []
+        for metric, proc in heapq.nlargest(limit, ranked, key=lambda item: item[0]):
+            try:
+                # Reuse the ranked value: a second cpu_percent read would
+                # measure an almost empty interval
+                info = proc.as_dict([attr for attr in PROCESS_ATTRS if attr != sort_by])
+            except psutil.NoSuchProcess:
+                continue
+            info[sort_by] = metric
+            processes.append(self._process_info(info))
         
-        return processes[:limit]
+        return processes
+    
+    def _process_info(self, info: Dict) -> Dict:
+        """Normalize a process info dict, defaulting missing percentages to 0."""
+        info['cpu_percent'] = info.get('cpu_percent') or 0
+        info['memory_percent'] = info.get('memory_percent') or 0
+        return info
     
     def monitor_continuous(self, duration: int, interval: int = 1, 
-                          callback: Optional[callable] = None):
-        """Monitor system continuously for specified duration."""
-        start_time = time.time()
+                          callback: Optional[callable] = None,
+                          stop_event: Optional[threading.Event] = None):
+        """Monitor system continuously for specified duration or until stop_event is set."""
+        stop = stop_event or threading.Event()
+        deadline = time.monotonic() + duration
         
-        while time.time() - start_time < duration:
+        while not stop.is_set() and time.monotonic() < deadline:
             stats = self.get_system_stats()
             alerts = self.check_thresholds(stats)
             
             if callback:
                 callback(stats, alerts)
             
-            time.sleep(interval)
+            stop.wait(interval)
     
     def get_system_load(self) -> Optional[tuple]:
         """Get system load average (Unix-like systems only)."""
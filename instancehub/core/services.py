@@ -2,11 +2,205 @@
 Service management core functionality.
 """
 
+import errno
+import functools
+import importlib
 import redis
+import select
 import socket
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from redis.connection import DefaultParser
+from redis.utils import HIREDIS_AVAILABLE
 from typing import Dict, List, Optional, Tuple
 
+# Connection pools shared by every RedisManager, keyed on (host, port, db, password)
+_POOL_CACHE: Dict[tuple, redis.BlockingConnectionPool] = {}
+
+# TCP keepalive: first probe after 30 idle seconds, then every 10 seconds,
+# giving up after 3 misses. Only the options the platform supports are set.
+_KEEPALIVE_OPTIONS = {
+    getattr(socket, name): value
+    for name, value in (('TCP_KEEPIDLE', 30), ('TCP_KEEPINTVL', 10), ('TCP_KEEPCNT', 3))
+    if hasattr(socket, name)
+}
+
+# redis-py picks the hiredis reply parser on its own when hiredis is
+# installed; it is also requested explicitly so the choice is visible here
+PARSER_NAME = 'hiredis' if HIREDIS_AVAILABLE else 'python'
+_PARSER_OPTIONS = {'parser_class': DefaultParser} if HIREDIS_AVAILABLE else {}
+
+# Returns TYPE, PTTL and MEMORY USAGE for every key in KEYS as a flat
+# [type, pttl, memory, ...] list; memory is -1 where it cannot be read
+KEY_METADATA_SCRIPT = """
+local out = {}
+for _, key in ipairs(KEYS) do
+    out[#out + 1] = redis.call('TYPE', key).ok
+    out[#out + 1] = redis.call('PTTL', key)
+    local memory = redis.pcall('MEMORY', 'USAGE', key)
+    out[#out + 1] = type(memory) == 'number' and memory or -1
+end
+return out
+"""
+
+# Seconds an INFO reply is reused, so back-to-back calls share one round trip
+INFO_CACHE_TTL = 0.5
+
+# Sections included in a plain INFO reply; others (commandstats, latencystats,
+# all, everything, ...) must be requested by name
+DEFAULT_INFO_SECTIONS = frozenset({
+    'server', 'clients', 'memory', 'persistence', 'stats', 'replication',
+    'cpu', 'modules', 'errors', 'cluster', 'keyspace',
+})
+
+# Keys per metadata script call
+KEY_METADATA_BATCH = 1000
+
+def _scan_count(limit: int) -> int:
+    """
+    SCAN COUNT hint for collecting up to limit keys.
+    
+    COUNT bounds the slots examined per call, not the matches returned, so a
+    floor keeps sparse patterns from needing many round trips, and a ceiling
+    keeps each call short on the server.
+    """
+    return min(max(limit, 256), 1000)
+
+def _get_pool(host: str, port: int, db: int, password: Optional[str]) -> redis.ConnectionPool:
+    """
+    Return the shared connection pool for a Redis endpoint.
+    
+    The pool blocks for up to 5 seconds when all connections are checked
+    out, instead of failing with "Too many connections".
+    """
+    key = (host, port, db, password)
+    pool = _POOL_CACHE.get(key)
+    if pool is None:
+        pool = _POOL_CACHE.setdefault(key, redis.BlockingConnectionPool(
+            host=host,
+            port=port,
+            db=db,
+            password=password,
+            decode_responses=True,
+            socket_timeout=5,
+            socket_connect_timeout=2,
+            socket_keepalive=True,
+            socket_keepalive_options=_KEEPALIVE_OPTIONS,
+            retry_on_timeout=True,
+            health_check_interval=30,
+            max_connections=16,
+            timeout=5,
+            **_PARSER_OPTIONS
+        ))
+    return pool
+
+# Per-thread {pool: single-connection client}, shared by RedisManagers
+_THREAD_CLIENTS = threading.local()
+
+def _thread_clients() -> Dict[redis.BlockingConnectionPool, redis.StrictRedis]:
+    """Return the calling thread's clients keyed by connection pool."""
+    clients = getattr(_THREAD_CLIENTS, 'by_pool', None)
+    if clients is None:
+        clients = _THREAD_CLIENTS.by_pool = {}
+    return clients
+
+# Upper bound on concurrent health probes
+MAX_HEALTH_WORKERS = 32
+
+# Seconds a port probe result is reused, so one refresh pass probes each endpoint once
+PORT_CACHE_TTL = 1.0
+
+# Seconds a resolved address list is reused before DNS is queried again
+ADDR_CACHE_TTL = 30.0
+
+# (host, port) -> (expiry, getaddrinfo result)
+_ADDR_CACHE: Dict[Tuple[str, int], Tuple[float, list]] = {}
+
+def _resolve(host: str, port: int) -> list:
+    """Return getaddrinfo results for host:port, cached for ADDR_CACHE_TTL seconds."""
+    now = time.monotonic()
+    hit = _ADDR_CACHE.get((host, port))
+    if hit and hit[0] > now:
+        return hit[1]
+    
+    addresses = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+    _ADDR_CACHE[(host, port)] = (now + ADDR_CACHE_TTL, addresses)
+    return addresses
+
+# Health-check clients, keyed on (host, port, timeout); dropped again after a failure
+_REDIS_CLIENTS: Dict[tuple, redis.StrictRedis] = {}
+
+def _get_health_client(host: str, port: int, timeout: float) -> redis.StrictRedis:
+    """Return the cached health-check client for a Redis endpoint."""
+    key = (host, port, timeout)
+    client = _REDIS_CLIENTS.get(key)
+    if client is None:
+        pool = redis.BlockingConnectionPool(
+            host=host,
+            port=port,
+            socket_timeout=timeout,
+            socket_connect_timeout=min(timeout, 2),
+            socket_keepalive=True,
+            health_check_interval=30,
+            max_connections=8,
+            timeout=timeout
+        )
+        client = _REDIS_CLIENTS.setdefault(key, redis.StrictRedis(connection_pool=pool))
+        if client.connection_pool is not pool:
+            # Another thread cached a client first; ours never connected
+            pool.disconnect()
+    return client
+
+def _drop_health_client(host: str, port: int, timeout: float) -> None:
+    """Forget the cached health-check client for an endpoint and close its sockets."""
+    client = _REDIS_CLIENTS.pop((host, port, timeout), None)
+    if client is not None:
+        client.connection_pool.disconnect()
+
+@functools.lru_cache(maxsize=None)
+def _optional_driver(name: str):
+    """
+    Import an optional database driver once, returning None if it is missing.
+    
+    Drivers are resolved on the first deep check rather than at module
+    import, so commands that never probe a database do not load them, and a
+    missing driver costs one failed import per process instead of one per check.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+# Seconds Redis commands are skipped after a connection failure
+REDIS_RETRY_AFTER = 1.0
+
+def _redis_call(default, stamp=True):
+    """
+    Decorate a RedisManager method to return default on redis.RedisError.
+    
+    A callable default is called per failure; stamp=False skips marking the call as proof of liveness.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self._down_until is not None and time.monotonic() < self._down_until:
+                return default() if callable(default) else default
+            try:
+                result = method(self, *args, **kwargs)
+            except (redis.ConnectionError, redis.TimeoutError):
+                self._down_until = time.monotonic() + REDIS_RETRY_AFTER
+                return default() if callable(default) else default
+            except redis.RedisError:
+                return default() if callable(default) else default
+            if stamp:
+                self._mark_ok()
+            return result
+        return wrapper
+    return decorator
+
 class RedisManager:
     """Manages Redis connections and operations."""
     
@@ -17,120 +211,221 @@ class RedisManager:
         self.port = port
         self.password = password
         self.db = db
-        self.client = None
+        # Monotonic time of the last command that succeeded, see is_alive
+        self._last_ok: Optional[float] = None
+        # Monotonic time until which commands are skipped after a connection failure
+        self._down_until: Optional[float] = None
+        # INFO replies keyed by section: (monotonic timestamp, parsed reply)
+        self._info_cache: Dict[Optional[str], Tuple[float, Dict]] = {}
         self._connect()
     
     def _connect(self):
         """Establish Redis connection."""
         try:
-            self.client = redis.StrictRedis(
-                host=self.host,
-                port=self.port,
-                password=self.password,
-                db=self.db,
-                decode_responses=True,
-                socket_timeout=5
-            )
+            self._pool = _get_pool(self.host, self.port, self.db, self.password)
+            # Registration is local; redis-py loads the script on first use
+            # and calls it by SHA (EVALSHA) afterwards
+            self._metadata_script = redis.StrictRedis(connection_pool=self._pool).register_script(KEY_METADATA_SCRIPT)
         except Exception as e:
             raise Exception(f"Failed to create Redis client: {e}")
     
+    @property
+    def client(self) -> redis.StrictRedis:
+        """
+        Redis client bound to the calling thread.
+        
+        Each thread keeps one connection per pool checked out, shared by every
+        manager for the same endpoint, so commands skip the pool's locked
+        checkout/checkin without holding a connection per manager. The
+        connection goes back to the pool when the client is closed or the
+        thread exits.
+        """
+        clients = _thread_clients()
+        client = clients.get(self._pool)
+        if client is None:
+            client = clients[self._pool] = redis.StrictRedis(connection_pool=self._pool,
+                                                             single_connection_client=True)
+        return client
+    
+    def close(self) -> None:
+        """Return the calling thread's connection for this endpoint to the pool."""
+        client = _thread_clients().pop(self._pool, None)
+        if client is not None:
+            client.close()
+    
+    @_redis_call(default=False)
     def test_connection(self) -> bool:
         """Test Redis connection."""
-        try:
-            return self.client.ping()
-        except Exception:
-            return False
+        return self.client.ping()
+    
+    def _mark_ok(self) -> None:
+        """Record a command that reached the server and ended any back-off."""
+        self._last_ok = time.monotonic()
+        self._down_until = None
     
+    def is_alive(self, max_age: float = 1.0) -> bool:
+        """
+        Check whether the server is reachable.
+        
+        Any command that succeeded within max_age seconds counts as proof,
+        so a PING is only sent when there has been no recent traffic.
+        """
+        if self._last_ok is not None and time.monotonic() - self._last_ok < max_age:
+            return True
+        return self.test_connection()
+    
+    def _cached_info(self, section: Optional[str] = None) -> Dict:
+        """
+        Return INFO output for a section, reusing a reply younger than INFO_CACHE_TTL.
+        
+        A fresh default INFO reply also answers requests for the sections it
+        contains (DEFAULT_INFO_SECTIONS).
+        """
+        now = time.monotonic()
+        cache_keys = (section, None) if section is None or section.lower() in DEFAULT_INFO_SECTIONS else (section,)
+        for cache_key in cache_keys:
+            cached = self._info_cache.get(cache_key)
+            if cached and now - cached[0] < INFO_CACHE_TTL:
+                return cached[1]
+        
+        info = self.client.info(section) if section else self.client.info()
+        self._mark_ok()
+        self._info_cache[section] = (now, info)
+        return info
+    
+    @_redis_call(default=None, stamp=False)
     def get_server_info(self) -> Optional[Dict]:
         """Get Redis server information."""
-        try:
-            return self.client.info()
-        except Exception:
-            return None
+        return self._cached_info()
     
+    @_redis_call(default=0)
     def get_total_keys(self) -> int:
         """Get total number of keys in current database."""
-        try:
-            info = self.client.info('keyspace')
-            db_key = f'db{self.db}'
-            if db_key in info:
-                # Parse "keys=X,expires=Y,avg_ttl=Z"
-                keys_info = info[db_key]
-                keys_count = int(keys_info.split(',')[0].split('=')[1])
-                return keys_count
-            return 0
-        except Exception:
-            return 0
+        return self.client.dbsize()
     
+    @_redis_call(default=list)
     def get_keys(self, pattern: str = '*', limit: int = 100) -> List[str]:
         """Get keys matching pattern."""
-        try:
-            keys = []
-            for key in self.client.scan_iter(match=pattern, count=limit):
-                keys.append(key)
-                if len(keys) >= limit:
-                    break
-            return keys
-        except Exception:
+        return self._scan_keys(pattern, limit)
+    
+    def _scan_keys(self, pattern: str, limit: int) -> List[str]:
+        """Collect up to limit keys matching pattern with SCAN; errors propagate."""
+        # islice stops pulling from the SCAN iterator once limit keys are in
+        return list(islice(self.client.scan_iter(match=pattern, count=_scan_count(limit)), limit))
+    
+    @_redis_call(default=list)
+    def get_keys_with_metadata(self, pattern: str = '*', limit: int = 100) -> List[Tuple[str, str, int, Optional[int]]]:
+        """
+        Get keys matching pattern together with their type, TTL and memory usage.
+        
+        Keys are collected with SCAN and their TYPE/PTTL/MEMORY USAGE are read
+        server-side by a Lua script, one call per batch of keys. Servers that
+        refuse scripting fall back to a single pipelined round trip.
+        
+        Returns:
+            List of (key, type, ttl, memory) tuples, ttl in seconds (-1 no expiry,
+            -2 missing) and memory in bytes or None if unavailable
+        """
+        keys = self._scan_keys(pattern, limit)
+        if not keys:
             return []
+        
+        try:
+            results = []
+            for i in range(0, len(keys), KEY_METADATA_BATCH):
+                results.extend(self._metadata_script(keys=keys[i:i + KEY_METADATA_BATCH], client=self.client))
+        except redis.ResponseError:
+            results = self._pipeline_metadata(keys)
+        
+        return [
+            (key, key_type, -(-pttl // 1000) if pttl > 0 else pttl,
+             memory if isinstance(memory, int) and memory >= 0 else None)
+            for key, key_type, pttl, memory in zip(keys, results[::3], results[1::3], results[2::3])
+        ]
+    
+    def _pipeline_metadata(self, keys: List[str]) -> List:
+        """Read TYPE, PTTL and MEMORY USAGE for keys as a flat list in one pipeline round trip."""
+        pipe = self.client.pipeline(transaction=False)
+        for key in keys:
+            pipe.type(key)
+            pipe.pttl(key)
+            pipe.memory_usage(key)
+        # Servers without MEMORY USAGE yield an error object in its slot
+        return pipe.execute(raise_on_error=False)
     
+    @_redis_call(default='unknown')
     def get_key_type(self, key: str) -> str:
         """Get type of a key."""
-        try:
-            return self.client.type(key)
-        except Exception:
-            return 'unknown'
+        return self.client.type(key)
     
+    @_redis_call(default=-2)
     def get_key_ttl(self, key: str) -> int:
         """Get TTL of a key."""
-        try:
-            return self.client.ttl(key)
-        except Exception:
-            return -2
+        return self.client.ttl(key)
     
+    @_redis_call(default=False)
     def set_key(self, key: str, value: str, ttl: Optional[int] = None) -> bool:
         """Set a key-value pair."""
-        try:
-            if ttl:
-                return self.client.setex(key, ttl, value)
-            else:
-                return self.client.set(key, value)
-        except Exception:
-            return False
+        if ttl:
+            return self.client.setex(key, ttl, value)
+        else:
+            return self.client.set(key, value)
     
+    @_redis_call(default=None)
     def get_key(self, key: str) -> Optional[str]:
         """Get value of a key."""
-        try:
-            return self.client.get(key)
-        except Exception:
-            return None
+        return self.client.get(key)
     
+    @_redis_call(default=False)
     def delete_key(self, key: str) -> bool:
         """Delete a key."""
-        try:
-            return bool(self.client.delete(key))
-        except Exception:
-            return False
+        return bool(self.client.delete(key))
+    
+    @_redis_call(default=False)
+    def set_many(self, mapping: Dict[str, str], ttl: Optional[int] = None) -> bool:
+        """
+        Set several key-value pairs in one round trip.
+        
+        Without a TTL this is a single MSET; with one, SETEX commands are sent
+        on a non-transactional pipeline.
+        """
+        if not mapping:
+            return True
+        if not ttl:
+            return self.client.mset(mapping)
+        pipe = self.client.pipeline(transaction=False)
+        for key, value in mapping.items():
+            pipe.setex(key, ttl, value)
+        return all(pipe.execute())
+    
+    @_redis_call(default=list)
+    def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        """Get the values of several keys with a single MGET."""
+        return self.client.mget(keys) if keys else []
+    
+    @_redis_call(default=0)
+    def delete_many(self, keys: List[str]) -> int:
+        """Delete several keys with a single UNLINK; memory is reclaimed in the background."""
+        return self.client.unlink(*keys) if keys else 0
     
+    @_redis_call(default=False)
     def flush_db(self) -> bool:
         """Flush current database."""
-        try:
-            return self.client.flushdb()
-        except Exception:
-            return False
+        return self.client.flushdb()
     
+    @_redis_call(default=None)
     def get_memory_usage(self, key: str) -> Optional[int]:
         """Get memory usage of a key."""
-        try:
-            return self.client.memory_usage(key)
-        except Exception:
-            return None
+        return self.client.memory_usage(key)
 
 class ServiceHealthChecker:
     """Check health of various services."""
     
-    def __init__(self):
-        """Initialize health checker."""
+    def __init__(self, timeout: float = 5, default_ports: Optional[Dict[str, int]] = None):
+        """Initialize health checker with a per-probe timeout in seconds and port overrides."""
+        self.timeout = timeout
+        # (host, port) -> (expiry, is_open)
+        self._port_cache: Dict[Tuple[str, int], Tuple[float, bool]] = {}
         self.default_ports = {
             'redis': 6379,
             'postgresql': 5432,
@@ -140,12 +435,17 @@ class ServiceHealthChecker:
             'rabbitmq': 5672,
             'memcached': 11211
         }
+        if default_ports:
+            self.default_ports.update({name.lower(): port for name, port in default_ports.items()})
     
     def check_service(self, service_name: str, host: str = 'localhost', 
-                     port: Optional[int] = None) -> Tuple[str, str]:
+                     port: Optional[int] = None, deep: bool = False) -> Tuple[str, str]:
         """
         Check if a service is healthy.
         
+        By default only a TCP connection to the service port is attempted;
+        with deep=True a protocol-level check follows for known services.
+        
         Returns:
             Tuple of (status, details) where status is 'healthy' or 'unhealthy'
         """
@@ -158,7 +458,13 @@ class ServiceHealthChecker:
         if not self._check_port(host, port):
             return 'unhealthy', f'Port {port} is not accessible'
         
-        # Service-specific health checks
+        if not deep:
+            return 'healthy', f'TCP {host}:{port} reachable'
+        
+        return self._deep_check(service_name, host, port)
+    
+    def _deep_check(self, service_name: str, host: str, port: int) -> Tuple[str, str]:
+        """Run the protocol-level check for a service whose port is open."""
         if service_name.lower() == 'redis':
             return self._check_redis_health(host, port)
         elif service_name.lower() in ['postgresql', 'postgres']:
@@ -170,78 +476,125 @@ class ServiceHealthChecker:
         else:
             return 'healthy', f'Port {port} is accessible'
     
-    def _check_port(self, host: str, port: int, timeout: int = 5) -> bool:
-        """Check if a port is open."""
+    def _check_port(self, host: str, port: int) -> bool:
+        """Check if a port is open, reusing a result younger than PORT_CACHE_TTL."""
+        now = time.monotonic()
+        hit = self._port_cache.get((host, port))
+        if hit and hit[0] > now:
+            return hit[1]
+        
+        is_open = self._probe_port(host, port)
+        self._port_cache[(host, port)] = (time.monotonic() + PORT_CACHE_TTL, is_open)
+        return is_open
+    
+    def _probe_port(self, host: str, port: int) -> bool:
+        """
+        Attempt a TCP connection to host:port.
+        
+        Uses non-blocking connects bounded by one overall deadline, so a host
+        with several addresses cannot hold a worker for a timeout per address.
+        Addresses come from the resolver cache, so repeated probes skip DNS
+        and a dead address falls through to the next one without a new lookup.
+        """
+        deadline = time.monotonic() + self.timeout
         try:
-            with socket.create_connection((host, port), timeout=timeout):
-                return True
-        except (socket.timeout, socket.error):
+            addresses = _resolve(host, port)
+        except socket.gaierror:
             return False
+        
+        for family, sock_type, proto, _, address in addresses:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            with socket.socket(family, sock_type, proto) as sock:
+                sock.setblocking(False)
+                if sock.connect_ex(address) not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    continue
+                _, writable, _ = select.select([], [sock], [], remaining)
+                if writable and sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                    return True
+        return False
     
     def _check_redis_health(self, host: str, port: int) -> Tuple[str, str]:
-        """Check Redis health."""
+        """
+        Check Redis health.
+        
+        PING and INFO server are pipelined, so the check costs one round trip.
+        """
         try:
-            redis_client = redis.StrictRedis(host=host, port=port, socket_timeout=5)
-            if redis_client.ping():
-                info = redis_client.info()
+            redis_client = _get_health_client(host, port, self.timeout)
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.ping()
+            pipe.info('server')
+            pong, info = pipe.execute()
+            if pong:
                 version = info.get('redis_version', 'unknown')
                 return 'healthy', f'Redis {version} responding'
             else:
                 return 'unhealthy', 'Redis not responding to ping'
         except Exception as e:
+            # Start from a fresh client next time in case this one is broken
+            _drop_health_client(host, port, self.timeout)
             return 'unhealthy', f'Redis error: {str(e)}'
     
     def _check_postgresql_health(self, host: str, port: int) -> Tuple[str, str]:
         """Check PostgreSQL health."""
+        psycopg2 = _optional_driver('psycopg2')
+        if psycopg2 is None:
+            return 'healthy', 'Port accessible (psycopg2 not installed for detailed check)'
         try:
-            # Try to import psycopg2
-            import psycopg2
             conn = psycopg2.connect(
                 host=host,
                 port=port,
                 user='postgres',  # Default user
-                connect_timeout=5
+                connect_timeout=max(1, int(self.timeout))
             )
             conn.close()
             return 'healthy', 'PostgreSQL accepting connections'
-        except ImportError:
-            return 'healthy', 'Port accessible (psycopg2 not installed for detailed check)'
         except Exception as e:
             return 'unhealthy', f'PostgreSQL error: {str(e)}'
     
     def _check_mysql_health(self, host: str, port: int) -> Tuple[str, str]:
         """Check MySQL health."""
+        mysql_connector = _optional_driver('mysql.connector')
+        if mysql_connector is None:
+            return 'healthy', 'Port accessible (mysql-connector not installed for detailed check)'
         try:
-            # Try to import mysql connector
-            import mysql.connector
-            conn = mysql.connector.connect(
+            conn = mysql_connector.connect(
                 host=host,
                 port=port,
-                connection_timeout=5
+                connection_timeout=max(1, int(self.timeout))
             )
             conn.close()
             return 'healthy', 'MySQL accepting connections'
-        except ImportError:
-            return 'healthy', 'Port accessible (mysql-connector not installed for detailed check)'
         except Exception as e:
             return 'unhealthy', f'MySQL error: {str(e)}'
     
     def _check_mongodb_health(self, host: str, port: int) -> Tuple[str, str]:
         """Check MongoDB health."""
+        pymongo = _optional_driver('pymongo')
+        if pymongo is None:
+            return 'healthy', 'Port accessible (pymongo not installed for detailed check)'
         try:
-            # Try to import pymongo
-            import pymongo
-            client = pymongo.MongoClient(host, port, serverSelectionTimeoutMS=5000)
-            client.server_info()  # Force connection
+            client = pymongo.MongoClient(host, port, serverSelectionTimeoutMS=int(self.timeout * 1000))
+            try:
+                client.server_info()  # Force connection
+            finally:
+                client.close()
             return 'healthy', 'MongoDB accepting connections'
-        except ImportError:
-            return 'healthy', 'Port accessible (pymongo not installed for detailed check)'
         except Exception as e:
             return 'unhealthy', f'MongoDB error: {str(e)}'
     
-    def check_multiple_services(self, services: List[str], host: str = 'localhost') -> Dict[str, Tuple[str, str]]:
-        """Check multiple services at once."""
-        results = {}
-        for service in services:
-            results[service] = self.check_service(service, host)
-        return results
+    def check_multiple_services(self, services: List[str], host: str = 'localhost',
+                                deep: bool = False) -> Dict[str, Tuple[str, str]]:
+        """
+        Check multiple services concurrently.
+        
+        Each probe is independent network I/O, so total wall time is bounded
+        by the slowest service rather than the sum of all of them.
+        """
+        if not services:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(MAX_HEALTH_WORKERS, len(services))) as executor:
+            results = executor.map(lambda service: self.check_service(service, host, deep=deep), services)
+            return dict(zip(services, results))
@@ -0,0 +1,101 @@
+"""
+Asynchronous service health checks for probing many hosts at once.
+"""
+
+import asyncio
+from itertools import product
+from typing import Dict, List, Optional, Tuple
+
+from instancehub.core.services import ServiceHealthChecker
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    # redis-py older than 4.2 has no asyncio client
+    aioredis = None
+
+class AsyncServiceHealthChecker(ServiceHealthChecker):
+    """
+    Check health of services on one event loop.
+    
+    Port probes and Redis checks are native coroutines, so thousands of
+    endpoints can be in flight on a single thread. Deep checks for other
+    services reuse the blocking implementations in a worker thread.
+    """
+    
+    async def check_service_async(self, service_name: str, host: str = 'localhost',
+                                  port: Optional[int] = None, deep: bool = False) -> Tuple[str, str]:
+        """
+        Check if a service is healthy.
+        
+        Returns:
+            Tuple of (status, details) where status is 'healthy' or 'unhealthy'
+        """
+        if port is None:
+            port = self.default_ports.get(service_name.lower())
+            if port is None:
+                return 'unhealthy', 'Unknown service or port not specified'
+        
+        if not await self._check_port_async(host, port):
+            return 'unhealthy', f'Port {port} is not accessible'
+        
+        if not deep:
+            return 'healthy', f'TCP {host}:{port} reachable'
+        
+        if service_name.lower() == 'redis' and aioredis is not None:
+            return await self._check_redis_health_async(host, port)
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._deep_check, service_name, host, port)
+    
+    async def _check_port_async(self, host: str, port: int) -> bool:
+        """Check if a port is open."""
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=self.timeout)
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
+    
+    async def _check_redis_health_async(self, host: str, port: int) -> Tuple[str, str]:
+        """Check Redis health with PING and INFO server pipelined into one round trip."""
+        client = aioredis.Redis(host=host, port=port, socket_timeout=self.timeout,
+                                socket_connect_timeout=self.timeout)
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.ping()
+            pipe.info('server')
+            pong, info = await pipe.execute()
+            if pong:
+                version = info.get('redis_version', 'unknown')
+                return 'healthy', f'Redis {version} responding'
+            else:
+                return 'unhealthy', 'Redis not responding to ping'
+        except Exception as e:
+            return 'unhealthy', f'Redis error: {str(e)}'
+        finally:
+            # aclose() replaced close() in redis-py 5.0.1
+            await (client.aclose() if hasattr(client, 'aclose') else client.close())
+    
+    async def check_multiple_services_async(self, services: List[str], hosts: List[str],
+                                            deep: bool = False) -> Dict[Tuple[str, str], Tuple[str, str]]:
+        """
+        Check every service on every host concurrently.
+        
+        Returns:
+            Dictionary mapping (service, host) to (status, details)
+        """
+        targets = list(product(services, hosts))
+        results = await asyncio.gather(
+            *(self.check_service_async(service, host, deep=deep) for service, host in targets)
+        )
+        return dict(zip(targets, results))
+    
+    def check_fleet(self, services: List[str], hosts: List[str],
+                    deep: bool = False) -> Dict[Tuple[str, str], Tuple[str, str]]:
+        """Run check_multiple_services_async from synchronous code."""
+        return asyncio.run(self.check_multiple_services_async(services, hosts, deep=deep))
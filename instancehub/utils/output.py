@@ -1,43 +1,98 @@
 """
 Output formatting and console utilities.
+
+Rich is imported on first use rather than at import time, so commands that
+print nothing (such as ``--version``) do not pay for loading it. The shared
+``console`` (see get_console) and the ``*_STYLE`` constants are resolved
+lazily through the module ``__getattr__`` (PEP 562).
 """
 
 import sys
-from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.panel import Panel
-from rich.text import Text
-from rich import print as rprint
 
-console = Console()
+_console = None
+_console_options = {}
+# Bound console.print of the current console, set alongside _console
+_print = None
+
+# Status prefix markup; parsed into Text objects once, on first use
+_PREFIX_MARKUP = {
+    'success': "[green]✓[/green] ",
+    'error': "[red]✗[/red] ",
+    'warning': "[yellow]⚠[/yellow] ",
+    'info': "[blue]ℹ[/blue] ",
+}
+_prefixes = None
+
+# Shared styles for styled Text cells, built once on first access
+_STYLE_COLORS = {
+    'GREEN_STYLE': "green",
+    'YELLOW_STYLE': "yellow",
+    'RED_STYLE': "red",
+}
+
+def __getattr__(name):
+    """Resolve ``console`` and the shared styles on first access."""
+    if name == 'console':
+        return get_console()
+    if name in _STYLE_COLORS:
+        from rich.style import Style
+        style = Style(color=_STYLE_COLORS[name])
+        # Cache as a real module attribute so later lookups skip __getattr__
+        globals()[name] = style
+        return style
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def get_console():
+    """
+    Return the shared console, creating it on first use.
+    
+    Callers should look the console up when they print rather than binding
+    it at import time, since setup_console may replace it afterwards.
+    """
+    global _console, _print
+    if _console is None:
+        from rich.console import Console
+        _console = Console(**_console_options)
+        _print = _console.print
+    return _console
 
 def setup_console(verbose=False):
     """Setup console with appropriate settings."""
-    global console
-    if verbose:
-        console = Console(stderr=True, force_terminal=True)
-    else:
-        console = Console()
+    global _console, _console_options, _print
+    _console_options = {'stderr': True, 'force_terminal': True} if verbose else {}
+    # Rebuilt with the new options on next use
+    _console = None
+    _print = None
+
+def _print_status(kind, message):
+    """Print message after the precomputed prefix for kind."""
+    global _prefixes
+    from rich.text import Text
+    if _print is None:
+        get_console()
+    if _prefixes is None:
+        _prefixes = {key: Text.from_markup(markup) for key, markup in _PREFIX_MARKUP.items()}
+    _print(_prefixes[kind] + Text(str(message)))
 
 def print_success(message):
     """Print success message in green."""
-    rprint(f"[green]✓[/green] {message}")
+    _print_status('success', message)
 
 def print_error(message):
     """Print error message in red."""
-    rprint(f"[red]✗[/red] {message}")
+    _print_status('error', message)
 
 def print_warning(message):
     """Print warning message in yellow."""
-    rprint(f"[yellow]⚠[/yellow] {message}")
+    _print_status('warning', message)
 
 def print_info(message):
     """Print info message in blue."""
-    rprint(f"[blue]ℹ[/blue] {message}")
+    _print_status('info', message)
 
 def create_table(title, columns):
     """Create a rich table with given title and columns."""
+    from rich.table import Table
     table = Table(title=title)
     for column in columns:
         table.add_column(column['name'], style=column.get('style', 'white'))
@@ -45,29 +100,33 @@ def create_table(title, columns):
 
 def create_panel(content, title=None, style="blue"):
     """Create a rich panel with content."""
+    from rich.panel import Panel
     return Panel(content, title=title, border_style=style)
 
 def create_progress():
     """Create a progress bar."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
-        console=console
+        console=get_console()
     )
 
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 def format_bytes(bytes_value):
     """Format bytes to human readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.1f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.1f} PB"
+    if bytes_value < 1024:
+        return f"{bytes_value:.1f} B"
+    # Each unit is 2**10 times the previous one, so the bit length picks it directly
+    unit = min((int(bytes_value).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_value / (1 << (unit * 10)):.1f} {_BYTE_UNITS[unit]}"
 
 def format_uptime(seconds):
     """Format uptime in seconds to human readable format."""
-    days = seconds // 86400
-    hours = (seconds % 86400) // 3600
-    minutes = (seconds % 3600) // 60
+    days, remainder = divmod(int(seconds), 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes = remainder // 60
     
     if days > 0:
         return f"{days}d {hours}h {minutes}m"
@@ -0,0 +1,69 @@
+"""
+Test EC2 management helpers.
+"""
+
+import pytest
+from botocore.stub import Stubber
+from instancehub.core.aws import EC2Manager
+
+def _instance(instance_id, state):
+    """Minimal describe_instances entry."""
+    return {'InstanceId': instance_id, 'InstanceType': 't3.micro',
+            'State': {'Name': state}, 'Tags': [{'Key': 'Name', 'Value': instance_id}]}
+
+@pytest.fixture
+def ec2(monkeypatch):
+    """EC2 manager whose client is stubbed."""
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'testing')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'testing')
+    manager = EC2Manager('us-west-2')
+    with Stubber(manager.ec2_client) as stubber:
+        yield manager, stubber
+        stubber.assert_no_pending_responses()
+
+def test_get_instance_details_bulk_uses_one_call(ec2):
+    """Test several instances are described in a single request."""
+    manager, stubber = ec2
+    ids = ['i-1', 'i-2']
+    stubber.add_response('describe_instances',
+                         {'Reservations': [{'Instances': [_instance('i-1', 'running'), _instance('i-2', 'stopped')]}]},
+                         {'InstanceIds': ids})
+    details = manager.get_instance_details_bulk(ids)
+    assert details['i-1']['State'] == 'running'
+    assert details['i-2']['Name'] == 'i-2'
+
+def test_start_instance_skips_running_instances(ec2):
+    """Test only instances that are not running are started."""
+    manager, stubber = ec2
+    statuses = [{'InstanceId': 'i-1', 'InstanceState': {'Code': 16, 'Name': 'running'}},
+                {'InstanceId': 'i-2', 'InstanceState': {'Code': 80, 'Name': 'stopped'}}]
+    stubber.add_response('describe_instance_status', {'InstanceStatuses': statuses},
+                         {'InstanceIds': ['i-1', 'i-2'], 'IncludeAllInstances': True})
+    stubber.add_response('start_instances', {'StartingInstances': []}, {'InstanceIds': ['i-2']})
+    assert manager.start_instance(['i-1', 'i-2'])
+
+def test_iter_instances_stops_at_limit(ec2):
+    """Test no further pages are requested once the limit is reached."""
+    manager, stubber = ec2
+    page = {'Reservations': [{'Instances': [_instance('i-1', 'running'), _instance('i-2', 'running')]}],
+            'NextToken': 'more'}
+    stubber.add_response('describe_instances', page, {'Filters': [], 'MaxResults': 5})
+    assert [i['id'] for i in manager.iter_instances(limit=2)] == ['i-1', 'i-2']
+
+def test_restart_wait_sees_reboot_before_status_ok(ec2, monkeypatch):
+    """Test --wait polls past the pre-reboot 'ok' status before waiting for 'ok'."""
+    manager, stubber = ec2
+    monkeypatch.setattr('instancehub.core.aws.time.sleep', lambda seconds: None)
+    
+    def status(check):
+        return {'InstanceStatuses': [{'InstanceId': 'i-1', 'InstanceState': {'Name': 'running'},
+                                      'InstanceStatus': {'Status': check}}]}
+    
+    status_params = {'InstanceIds': ['i-1'], 'IncludeAllInstances': True}
+    stubber.add_response('describe_instance_status', status('ok'), status_params)
+    stubber.add_response('reboot_instances', {}, {'InstanceIds': ['i-1']})
+    stubber.add_response('describe_instance_status', status('ok'), status_params)
+    stubber.add_response('describe_instance_status', status('initializing'), status_params)
+    stubber.add_response('describe_instance_status', status('ok'), {'InstanceIds': ['i-1']})
+    
+    assert manager.restart_instance('i-1', wait=True)
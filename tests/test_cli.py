@@ -54,3 +54,23 @@ def test_config_help():
     result = runner.invoke(main, ['config', '--help'])
     assert result.exit_code == 0
     assert 'Configuration management' in result.output
+
+def test_instances_start_and_status_pass_ids_to_manager():
+    """Test start and status hand every instance ID to the EC2 manager."""
+    from unittest.mock import patch
+    
+    runner = CliRunner()
+    with patch('instancehub.core.aws.EC2Manager') as manager_class:
+        manager = manager_class.return_value
+        manager.start_instance.return_value = True
+        manager.get_instance_details_bulk.return_value = {'i-123': {'State': 'running'}}
+        
+        result = runner.invoke(main, ['instances', 'start', 'i-123', 'i-456'])
+        assert result.exit_code == 0
+        assert 'started successfully' in result.output
+        manager.start_instance.assert_called_once_with(('i-123', 'i-456'), wait=False)
+        
+        result = runner.invoke(main, ['instances', 'status', 'i-123', 'i-456'])
+        assert result.exit_code == 0
+        assert 'running' in result.output
+        assert 'Instance i-456 not found' in result.output
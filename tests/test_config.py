@@ -0,0 +1,112 @@
+"""
+Test configuration management.
+"""
+
+import pytest
+from click.testing import CliRunner
+from instancehub.cli import main
+from instancehub.config.manager import ConfigManager
+
+@pytest.fixture
+def config_manager(tmp_path):
+    """Config manager backed by a temporary directory."""
+    manager = ConfigManager(str(tmp_path))
+    manager.save_config(manager.create_default_config())
+    return manager
+
+def test_load_config_returns_independent_copies(config_manager):
+    """Test mutating a loaded config does not leak into later loads."""
+    config = config_manager.load_config()
+    config['aws']['default_region'] = 'eu-west-1'
+    assert config_manager.load_config()['aws']['default_region'] == 'us-east-1'
+
+def test_load_config_sees_external_edits(config_manager):
+    """Test the parse cache is invalidated when the file changes."""
+    config_manager.load_config()
+    config_manager.config_path.write_text("aws:\n  default_region: ap-south-1\n", encoding='utf-8')
+    assert config_manager.get_value('aws.default_region') == 'ap-south-1'
+
+def test_validate_config_reports_schema_errors(config_manager):
+    """Test validation reports missing keys and out-of-range values."""
+    config_manager.config_path.write_text(
+        "monitoring:\n  cpu_threshold: 150\n  memory_threshold: true\nredis:\n  default_port: 6379\n",
+        encoding='utf-8'
+    )
+    is_valid, errors = config_manager.validate_config()
+    assert not is_valid
+    assert errors == [
+        "Missing aws.default_region",
+        "Invalid monitoring.cpu_threshold: must be between 0 and 100",
+        "Invalid monitoring.memory_threshold: must be between 0 and 100",
+    ]
+
+def test_save_config_rejects_invalid_values(config_manager):
+    """Test invalid configuration is never written to disk."""
+    config = config_manager.load_config()
+    config['redis']['default_port'] = 70000
+    with pytest.raises(Exception, match="redis.default_port"):
+        config_manager.save_config(config)
+    assert config_manager.load_config()['redis']['default_port'] == 6379
+
+def test_config_set_coerces_values(tmp_path, monkeypatch):
+    """Test config set stores typed values under nested keys."""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    runner = CliRunner()
+    for key, value in [('monitoring.cpu_threshold', '75'), ('output.color', 'false'),
+                       ('aws.profile', '123abc'), ('extra.ratio', '0.5')]:
+        result = runner.invoke(main, ['config', 'set', key, value])
+        assert result.exit_code == 0
+    
+    config = ConfigManager().load_config()
+    assert config['monitoring']['cpu_threshold'] == 75
+    assert config['output']['color'] is False
+    assert config['aws']['profile'] == '123abc'
+    assert config['extra']['ratio'] == 0.5
+
+def test_set_values_writes_all_keys(config_manager):
+    """Test several dotted keys are applied in one save."""
+    config_manager.set_values({'monitoring.cpu_threshold': 50, 'aws.default_region': 'eu-west-1'})
+    assert config_manager.get_value('monitoring.cpu_threshold') == 50
+    assert config_manager.get_value('aws.default_region') == 'eu-west-1'
+    config_manager.get_value('monitoring')['cpu_threshold'] = 10
+    assert config_manager.get_value('monitoring.cpu_threshold') == 50
+
+def test_save_config_skips_unchanged_content(config_manager):
+    """Test saving an identical config leaves the file untouched."""
+    mtime = config_manager.config_path.stat().st_mtime_ns
+    config_manager.save_config(config_manager.load_config())
+    assert config_manager.config_path.stat().st_mtime_ns == mtime
+    assert not config_manager.config_path.with_suffix('.tmp').exists()
+
+def test_get_value_resolves_sections_and_leaves(config_manager):
+    """Test dotted lookups return leaves, whole sections or the default."""
+    assert config_manager.get_value('services.default_ports.mysql') == 3306
+    assert config_manager.get_value('redis')['default_db'] == 0
+    assert config_manager.get_value('redis.missing', 'fallback') == 'fallback'
+
+def test_config_edit_falls_back_when_editor_is_empty(tmp_path, monkeypatch):
+    """Test an empty EDITOR opens the platform default editor."""
+    import os
+    from unittest.mock import patch
+    
+    monkeypatch.setenv('HOME', str(tmp_path))
+    monkeypatch.setenv('EDITOR', '')
+    runner = CliRunner()
+    assert runner.invoke(main, ['config', 'init']).exit_code == 0
+    
+    with patch('subprocess.run') as run:
+        result = runner.invoke(main, ['config', 'edit'])
+    
+    assert result.exit_code == 0
+    command = run.call_args[0][0]
+    default_editor = 'notepad' if os.name == 'nt' else 'nano'
+    assert os.path.basename(command[0]).startswith(default_editor)
+    assert command[-1].endswith('config.yaml')
+
+@pytest.mark.parametrize('region', ['null', "''", "'  '"])
+def test_validate_config_rejects_empty_region(config_manager, region):
+    """Test a null or blank default region is not accepted as valid."""
+    config_manager.config_path.write_text(f"aws:\n  default_region: {region}\n", encoding='utf-8')
+    is_valid, errors = config_manager.validate_config()
+    assert not is_valid
+    assert errors in (["Missing aws.default_region"], ["Invalid aws.default_region: must not be empty"])
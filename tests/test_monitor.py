@@ -0,0 +1,83 @@
+"""
+Test system monitoring helpers.
+"""
+
+import pickle
+from types import SimpleNamespace
+from instancehub.core import monitor
+from instancehub.core.monitor import SystemStats
+
+def test_system_stats_pickle_round_trip():
+    """Test frozen, slotted SystemStats survives pickling."""
+    stats = SystemStats(12.5, 40.0, 55.5, 1024, 2048, 3600.0, 42)
+    assert pickle.loads(pickle.dumps(stats)) == stats
+
+PROC_STAT_SAMPLE = (
+    "cpu  100 20 30 800 50 0 0 0 0 0\n"
+    "cpu0 100 20 30 800 50 0 0 0 0 0\n"
+)
+
+PROC_MEMINFO_SAMPLE = (
+    "MemTotal:        8000000 kB\n"
+    "MemFree:         1000000 kB\n"
+    "MemAvailable:    6000000 kB\n"
+)
+
+def test_read_proc_cpu_times(tmp_path, monkeypatch):
+    """Test busy and total jiffies come from the aggregate /proc/stat line."""
+    stat = tmp_path / 'stat'
+    stat.write_text(PROC_STAT_SAMPLE)
+    monkeypatch.setattr(monitor, 'PROC_STAT', str(stat))
+    assert monitor._read_proc_cpu_times() == (150, 1000)
+    
+    stat.write_text("cpu  garbage\n")
+    assert monitor._read_proc_cpu_times() is None
+    monkeypatch.setattr(monitor, 'PROC_STAT', str(tmp_path / 'missing'))
+    assert monitor._read_proc_cpu_times() is None
+
+def test_read_proc_memory_percent(tmp_path, monkeypatch):
+    """Test used memory percent is derived from MemTotal and MemAvailable."""
+    meminfo = tmp_path / 'meminfo'
+    meminfo.write_text(PROC_MEMINFO_SAMPLE)
+    monkeypatch.setattr(monitor, 'PROC_MEMINFO', str(meminfo))
+    assert monitor._read_proc_memory_percent() == 25.0
+    
+    meminfo.write_text("MemTotal:        8000000 kB\n")
+    assert monitor._read_proc_memory_percent() is None
+
+def test_system_stats_fall_back_to_psutil(monkeypatch):
+    """Test CPU and memory figures come from psutil when /proc is unreadable."""
+    monkeypatch.setattr(monitor, '_read_proc_cpu_times', lambda: None)
+    monkeypatch.setattr(monitor, '_read_proc_memory_percent', lambda: None)
+    monkeypatch.setattr(monitor.psutil, 'cpu_percent', lambda interval=None: 12.5)
+    monkeypatch.setattr(monitor.psutil, 'virtual_memory', lambda: SimpleNamespace(percent=42.0))
+    
+    stats = monitor.SystemMonitor().get_system_stats()
+    assert stats.cpu_percent == 12.5
+    assert stats.memory_percent == 42.0
+
+def test_count_inet_sockets_reads_sockstat(tmp_path, monkeypatch):
+    """Test inet sockets are summed from sockstat, with a psutil fallback."""
+    sockstat = tmp_path / 'sockstat'
+    sockstat.write_text(
+        "sockets: used 120\n"
+        "TCP: inuse 5 orphan 0 tw 2 alloc 8 mem 1\n"
+        "UDP: inuse 3 mem 2\n"
+    )
+    sockstat6 = tmp_path / 'sockstat6'
+    sockstat6.write_text("TCP6: inuse 4\nUDP6: inuse 1\n")
+    monkeypatch.setattr(monitor.psutil, 'net_connections', lambda kind: [object()] * 99)
+    
+    monkeypatch.setattr(monitor, 'SOCKSTAT_FILES', (str(sockstat), str(sockstat6)))
+    assert monitor._count_inet_sockets() == 15
+    
+    # sockstat6 missing (IPv6 disabled) still counts IPv4 sockets
+    monkeypatch.setattr(monitor, 'SOCKSTAT_FILES', (str(sockstat), str(tmp_path / 'missing')))
+    assert monitor._count_inet_sockets() == 10
+    
+    monkeypatch.setattr(monitor, 'SOCKSTAT_FILES', (str(tmp_path / 'missing'),))
+    assert monitor._count_inet_sockets() == 99
+    
+    sockstat.write_text("TCP: inuse many\n")
+    monkeypatch.setattr(monitor, 'SOCKSTAT_FILES', (str(sockstat),))
+    assert monitor._count_inet_sockets() == 99
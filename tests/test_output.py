@@ -0,0 +1,60 @@
+"""
+Test output formatting helpers.
+"""
+
+import pytest
+from instancehub.utils import output
+from instancehub.utils.output import format_bytes, format_uptime
+
+@pytest.mark.parametrize('value, expected', [
+    (0, '0.0 B'),
+    (1023, '1023.0 B'),
+    (1024, '1.0 KB'),
+    (1536.0, '1.5 KB'),
+    (1024 ** 2 - 1, '1024.0 KB'),
+    (5 * 1024 ** 3, '5.0 GB'),
+    (3 * 1024 ** 6, '3072.0 PB'),
+])
+def test_format_bytes(value, expected):
+    """Test byte counts pick the right unit."""
+    assert format_bytes(value) == expected
+
+@pytest.mark.parametrize('seconds, expected', [
+    (59, '0m'),
+    (3599.9, '59m'),
+    (3600, '1h 0m'),
+    (90061.5, '1d 1h 1m'),
+])
+def test_format_uptime(seconds, expected):
+    """Test uptimes render whole days, hours and minutes."""
+    assert format_uptime(seconds) == expected
+
+def test_print_helpers_follow_verbose_console(capsys):
+    """Test status messages and tables go to the console set up by setup_console."""
+    output.setup_console(verbose=True)
+    try:
+        output.print_success("done")
+        output.get_console().print(output.create_table("Results", [{'name': 'Metric'}]))
+        captured = capsys.readouterr()
+        assert "done" in captured.err
+        assert "Results" in captured.err
+        assert captured.out == ""
+    finally:
+        output.setup_console()
+
+def test_verbose_cli_output_shares_one_stream(tmp_path, monkeypatch):
+    """Test -v routes command tables and status lines to the same stream."""
+    from click.testing import CliRunner
+    from instancehub.cli import main
+    
+    monkeypatch.setenv('HOME', str(tmp_path))
+    runner = CliRunner()
+    try:
+        assert runner.invoke(main, ['config', 'init']).exit_code == 0
+        result = runner.invoke(main, ['-v', 'config', 'show'])
+    finally:
+        output.setup_console()
+    assert result.exit_code == 0
+    assert 'Configuration file' in result.stderr
+    assert 'AWS Configuration' in result.stderr
+    assert result.stdout == ''
@@ -0,0 +1,226 @@
+"""
+Test service health checks.
+"""
+
+import socket
+import sys
+import pytest
+import redis
+from unittest.mock import Mock
+from click.testing import CliRunner
+from instancehub.cli import main
+from instancehub.commands import services as services_commands
+from instancehub.core import services
+from instancehub.core.services import RedisManager, ServiceHealthChecker
+from instancehub.core.services_async import AsyncServiceHealthChecker
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    """Mock Redis client served to every RedisManager."""
+    client = Mock()
+    monkeypatch.setattr(RedisManager, 'client', property(lambda self: client))
+    return client
+
+@pytest.fixture
+def manager(redis_client):
+    """RedisManager whose commands go to the redis_client mock."""
+    return RedisManager('127.0.0.1', 6379)
+
+def test_health_check_defaults_to_tcp_probe():
+    """Test a listening port is healthy without a protocol-level check."""
+    with socket.socket() as server:
+        server.bind(('127.0.0.1', 0))
+        server.listen()
+        port = server.getsockname()[1]
+        
+        checker = ServiceHealthChecker(timeout=1, default_ports={'Redis': port})
+        results = checker.check_multiple_services(['redis', 'unknown'], host='127.0.0.1')
+    
+    assert results['redis'] == ('healthy', f'TCP 127.0.0.1:{port} reachable')
+    assert results['unknown'][0] == 'unhealthy'
+
+def test_async_checker_probes_every_host():
+    """Test the async checker reports each (service, host) pair."""
+    with socket.socket() as server:
+        server.bind(('127.0.0.1', 0))
+        server.listen()
+        port = server.getsockname()[1]
+        
+        checker = AsyncServiceHealthChecker(timeout=1, default_ports={'redis': port})
+        results = checker.check_fleet(['redis'], ['127.0.0.1', 'nonexistent.invalid'])
+    
+    assert results[('redis', '127.0.0.1')][0] == 'healthy'
+    assert results[('redis', 'nonexistent.invalid')][0] == 'unhealthy'
+
+def test_port_probe_results_are_reused(monkeypatch):
+    """Test back-to-back probes of one endpoint make a single connection attempt."""
+    checker = ServiceHealthChecker(timeout=1)
+    calls = []
+    monkeypatch.setattr(checker, '_probe_port', lambda host, port: calls.append((host, port)) or True)
+    
+    assert checker._check_port('127.0.0.1', 6379)
+    assert checker._check_port('127.0.0.1', 6379)
+    assert calls == [('127.0.0.1', 6379)]
+
+def test_resolve_caches_addresses(monkeypatch):
+    """Test repeated lookups of one endpoint query DNS once."""
+    calls = []
+    def fake_getaddrinfo(*args):
+        calls.append(args)
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('127.0.0.1', 6379))]
+    
+    monkeypatch.setattr(services, '_ADDR_CACHE', {})
+    monkeypatch.setattr(services.socket, 'getaddrinfo', fake_getaddrinfo)
+    
+    assert services._resolve('cache.example', 6379) == services._resolve('cache.example', 6379)
+    assert len(calls) == 1
+
+def test_redis_manager_skips_calls_while_server_is_down(manager, redis_client):
+    """Test a connection failure short-circuits later calls to their defaults."""
+    redis_client.get.side_effect = redis.ConnectionError('refused')
+    
+    assert manager.get_key('a') is None
+    assert manager.get_keys() == []
+    assert redis_client.get.call_count == 1
+    assert not redis_client.scan_iter.called
+
+def test_redis_manager_lets_programming_errors_raise(manager, redis_client):
+    """Test only Redis errors are turned into defaults."""
+    redis_client.type.side_effect = TypeError('bug')
+    with pytest.raises(TypeError):
+        manager.get_key_type('a')
+
+def test_cached_info_does_not_count_as_liveness(manager, redis_client, monkeypatch):
+    """Test an INFO reply served from cache does not stand in for a PING."""
+    clock = [100.0]
+    monkeypatch.setattr(services.time, 'monotonic', lambda: clock[0])
+    redis_client.info.return_value = {'redis_version': '7.2.0'}
+    
+    assert manager.get_server_info()['redis_version'] == '7.2.0'
+    clock[0] = 100.4
+    assert manager.get_server_info()['redis_version'] == '7.2.0'
+    assert redis_client.info.call_count == 1
+    
+    clock[0] = 101.2
+    assert manager.is_alive(max_age=1.0)
+    assert redis_client.ping.called
+
+def test_metadata_scan_failure_keeps_back_off(manager, redis_client):
+    """Test a connection failure inside get_keys_with_metadata starts the back-off."""
+    redis_client.scan_iter.side_effect = redis.ConnectionError('refused')
+    
+    assert manager.get_keys_with_metadata() == []
+    assert not manager.is_alive()
+    assert not redis_client.ping.called
+
+def test_health_ignores_malformed_config(tmp_path, monkeypatch):
+    """Test services health falls back to defaults when the config cannot be read."""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    config_dir = tmp_path / '.instancehub'
+    config_dir.mkdir()
+    (config_dir / 'config.yaml').write_text("services: [unclosed\n", encoding='utf-8')
+    
+    result = CliRunner().invoke(main, ['services', 'health', '-s', 'unknown'])
+    assert result.exit_code == 0
+    assert 'Ignoring configuration' in result.output
+    assert 'Unknown service' in result.output
+
+def test_health_rejects_non_numeric_timeout(tmp_path, monkeypatch):
+    """Test an invalid health_check_timeout is replaced by the default."""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    config_dir = tmp_path / '.instancehub'
+    config_dir.mkdir()
+    (config_dir / 'config.yaml').write_text(
+        "services:\n  health_check_timeout: soon\n  default_ports:\n    redis: 6380\n", encoding='utf-8'
+    )
+    
+    options = services_commands._health_check_options()
+    assert options == {'timeout': services_commands.DEFAULT_HEALTH_TIMEOUT, 'default_ports': {'redis': 6380}}
+
+def test_stream_command_drops_progress_updates(capsys):
+    """Test carriage-return progress updates collapse to the final line text."""
+    script = (
+        "import sys\n"
+        "for i in range(3): sys.stdout.write('SET: rps=%d\\r' % i)\n"
+        "sys.stdout.write('SET: 100 requests per second\\n')\n"
+    )
+    returncode, stderr = services_commands._stream_command([sys.executable, '-c', script], timeout=30)
+    
+    assert returncode == 0
+    assert stderr == ''
+    assert capsys.readouterr().out.splitlines() == ['SET: 100 requests per second']
+
+def test_stream_command_drains_large_stderr():
+    """Test a child writing more than a pipe buffer to stderr still completes."""
+    script = "import sys\nsys.stderr.write('x' * 1000000)\nprint('done')\n"
+    returncode, stderr = services_commands._stream_command([sys.executable, '-c', script], timeout=30)
+    
+    assert returncode == 0
+    assert len(stderr) == 1000000
+
+def test_redis_managers_share_a_thread_connection(monkeypatch):
+    """Test managers for one endpoint reuse the calling thread's client."""
+    monkeypatch.setattr(services.redis, 'StrictRedis', Mock(side_effect=lambda **kwargs: Mock()))
+    first = RedisManager('127.0.0.1', 6390)
+    second = RedisManager('127.0.0.1', 6390)
+    
+    shared = first.client
+    assert second.client is shared
+    first.close()
+    shared.close.assert_called_once_with()
+    assert second.client is not shared
+    second.close()
+
+def test_cached_info_only_reuses_default_sections(manager, redis_client):
+    """Test a cached default INFO reply does not answer non-default sections."""
+    redis_client.info.side_effect = lambda section=None: {'section': section}
+    
+    assert manager._cached_info() == {'section': None}
+    assert manager._cached_info('memory') == {'section': None}
+    assert manager._cached_info('commandstats') == {'section': 'commandstats'}
+    assert redis_client.info.call_count == 2
+
+def test_failed_redis_health_check_closes_cached_client(monkeypatch):
+    """Test a failing health client is dropped and its pool disconnected."""
+    client = Mock()
+    client.pipeline.return_value.execute.side_effect = redis.ConnectionError('reset')
+    monkeypatch.setattr(services, '_REDIS_CLIENTS', {('127.0.0.1', 6379, 1): client})
+    
+    status, _ = ServiceHealthChecker(timeout=1)._check_redis_health('127.0.0.1', 6379)
+    assert status == 'unhealthy'
+    assert services._REDIS_CLIENTS == {}
+    client.connection_pool.disconnect.assert_called_once_with()
+
+def test_set_many_uses_mset_or_setex_pipeline(manager, redis_client):
+    """Test set_many sends one MSET, or pipelined SETEX commands when given a TTL."""
+    redis_client.mset.return_value = True
+    assert manager.set_many({'a': '1', 'b': '2'})
+    redis_client.mset.assert_called_once_with({'a': '1', 'b': '2'})
+    
+    pipe = redis_client.pipeline.return_value
+    pipe.execute.return_value = [True, False]
+    assert not manager.set_many({'a': '1', 'b': '2'}, ttl=60)
+    redis_client.pipeline.assert_called_once_with(transaction=False)
+    assert pipe.setex.call_count == 2
+    pipe.setex.assert_any_call('b', 60, '2')
+
+def test_get_and_delete_many_map_replies(manager, redis_client):
+    """Test get_many and delete_many return the MGET and UNLINK replies."""
+    redis_client.mget.return_value = ['1', None]
+    redis_client.unlink.return_value = 1
+    
+    assert manager.get_many(['a', 'missing']) == ['1', None]
+    assert manager.delete_many(['a', 'missing']) == 1
+    redis_client.unlink.assert_called_once_with('a', 'missing')
+    assert manager.get_many([]) == [] and manager.delete_many([]) == 0
+    assert redis_client.mget.call_count == 1
+
+def test_batch_methods_return_defaults_on_redis_errors(manager, redis_client):
+    """Test a failing batch call falls back to the decorator default."""
+    redis_client.mset.side_effect = redis.ResponseError('OOM')
+    redis_client.mget.side_effect = redis.ResponseError('OOM')
+    redis_client.unlink.side_effect = redis.ResponseError('OOM')
+    
+    assert manager.set_many({'a': '1'}) is False
+    assert manager.get_many(['a']) == []
+    assert manager.delete_many(['a']) == 0